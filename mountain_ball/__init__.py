@@ -0,0 +1,18 @@
+# -*- coding: utf-8 -*-
+#  ╭─────────────────────────────────────────────────────────────────────╮
+#  │                                                                     │
+#  │ Ball Simulation Game: the physics engines, terrain and game config. │
+#  │ Importing the package does not load Tk, asyncio or NumPy; the game  │
+#  │ window lives in mountain_ball.gui and the command line front end in │
+#  │ mountain_ball.cli.                                                  │
+#  │                                                                     │
+#  ╰─────────────────────────────────────────────────────────────────────╯
+
+from .config import GameConfig, DEFAULTS
+from .terrain import generate_terrain, TerrainIndex, ChunkedTerrain
+from .engine import (BallEngine, EventEngine, EndlessEngine, MultiBallEngine,
+                     LeanEngine, ENGINES, run_headless)
+
+__all__ = ['GameConfig', 'DEFAULTS', 'generate_terrain', 'TerrainIndex',
+           'ChunkedTerrain', 'BallEngine', 'EventEngine', 'EndlessEngine',
+           'MultiBallEngine', 'LeanEngine', 'ENGINES', 'run_headless']
@@ -0,0 +1,223 @@
+# -*- coding: utf-8 -*-
+#  ╭───────────────────────────────────────────────────────────────╮
+#  │                                                               │
+#  │ asyncio scheduler for the game window, and the stats sinks it │
+#  │ publishes the score to.                                       │
+#  │                                                               │
+#  ╰───────────────────────────────────────────────────────────────╯
+
+import tkinter as tk
+import asyncio
+import time
+import json
+import sys
+
+class FileSink:
+    #  ╭─────────────────────────────────────────────────────────────────────╮
+    #  │                                                                     │
+    #  │ Stats sink appending one JSON line per update to a local file. The  │
+    #  │ writes run in a worker thread so a slow disk never blocks the loop. │
+    #  │                                                                     │
+    #  ╰─────────────────────────────────────────────────────────────────────╯
+    def __init__(self, path):
+        self.path = path
+
+    async def open(self):
+        self.file = open(self.path, 'a')
+
+    async def publish(self, stats):
+        await asyncio.to_thread(self.write, json.dumps(stats) + '\n')
+
+    def write(self, line):
+        self.file.write(line)
+        self.file.flush()
+
+    async def close(self):
+        self.file.close()
+
+class UDPSink:
+    #  ╭───────────────────────────────────────────────────────────────────╮
+    #  │                                                                   │
+    #  │ Stats sink sending each update as one JSON datagram to host:port. │
+    #  │ Datagrams are fire-and-forget: nobody listening costs nothing.    │
+    #  │                                                                   │
+    #  ╰───────────────────────────────────────────────────────────────────╯
+    def __init__(self, host, port):
+        self.address = (host, port)
+
+    async def open(self):
+        loop = asyncio.get_running_loop()
+        self.transport, _ = await loop.create_datagram_endpoint(
+            asyncio.DatagramProtocol, remote_addr=self.address)
+
+    async def publish(self, stats):
+        self.transport.sendto(json.dumps(stats).encode())
+
+    async def close(self):
+        self.transport.close()
+
+class UnixSink:
+    #  ╭────────────────────────────────────────────────────────────────────╮
+    #  │ Stats sink streaming JSON lines to a listening Unix domain socket. │
+    #  ╰────────────────────────────────────────────────────────────────────╯
+    def __init__(self, path):
+        self.path = path
+
+    async def open(self):
+        _, self.writer = await asyncio.open_unix_connection(self.path)
+
+    async def publish(self, stats):
+        self.writer.write(json.dumps(stats).encode() + b'\n')
+        await self.writer.drain()
+
+    async def close(self):
+        self.writer.close()
+        await self.writer.wait_closed()
+
+def parse_sink(spec):
+    #  ╭─────────────────────────────────────────────────────────╮
+    #  │                                                         │
+    #  │ Build a stats sink from "udp:HOST:PORT", "unix:PATH" or │
+    #  │ "[file:]PATH".                                          │
+    #  │                                                         │
+    #  ╰─────────────────────────────────────────────────────────╯
+    kind, _, target = spec.partition(':')
+    if kind == 'udp':
+        host, _, port = target.rpartition(':')
+        return UDPSink(host or '127.0.0.1', int(port))
+    if kind == 'unix':
+        return UnixSink(target)
+    if kind == 'file':
+        return FileSink(target)
+    return FileSink(spec)
+
+class AsyncGameLoop:
+    #  ╭─────────────────────────────────────────────────────────────────────╮
+    #  │                                                                     │
+    #  │ asyncio scheduler for a BallSimulation created with start=False, in │
+    #  │ place of its Tk timer loops. Physics, rendering, trail expiry,      │
+    #  │ stats publishing and the Tk event pump are separate coroutines on   │
+    #  │ one event loop. Each stats sink is fed through its own small queue  │
+    #  │ by its own task; when a sink falls behind, its oldest pending       │
+    #  │ update is dropped, so slow I/O never holds up a frame.              │
+    #  │                                                                     │
+    #  ╰─────────────────────────────────────────────────────────────────────╯
+    def __init__(self, sim, sinks=(), physics_rate=500, pump_interval=0.005,
+                 stats_interval=0.1, queue_size=16):
+        self.sim = sim
+        self.sinks = list(sinks)
+        self.physics_interval = 1 / physics_rate
+        self.pump_interval = pump_interval
+        self.stats_interval = stats_interval
+        self.queue_size = queue_size
+
+    def run(self):
+        #  ╭──────────────────────────────────╮
+        #  │ Play until the window is closed. │
+        #  ╰──────────────────────────────────╯
+        asyncio.run(self.main())
+
+    async def main(self):
+        #  ╭───────────────────────────────────────────────────────╮
+        #  │ Sinks that cannot be opened are reported and left out │
+        #  ╰───────────────────────────────────────────────────────╯
+        opened = []
+        for sink in self.sinks:
+            try:
+                await sink.open()
+            except OSError as error:
+                self.report(sink, error)
+                continue
+            opened.append(sink)
+        self.sinks = opened
+        self.queues = [asyncio.Queue(self.queue_size) for _ in self.sinks]
+        tasks = [asyncio.create_task(job) for job in (
+            self.physics(), self.render(), self.expire_trail(), self.stats())]
+        tasks += [asyncio.create_task(self.feed(sink, queue))
+                  for sink, queue in zip(self.sinks, self.queues)]
+        try:
+            #  ╭────────────────────────────────────────────────────────╮
+            #  │ The Tk pump returns when the window has been destroyed │
+            #  ╰────────────────────────────────────────────────────────╯
+            await self.pump_tk()
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            for sink in self.sinks:
+                try:
+                    await sink.close()
+                except OSError:
+                    pass
+
+    async def pump_tk(self):
+        #  ╭─────────────────────────────────────────────────────────────────╮
+        #  │ Process pending Tk events and redraws until the window is gone. │
+        #  ╰─────────────────────────────────────────────────────────────────╯
+        while True:
+            try:
+                self.sim.master.update()
+            except tk.TclError:
+                return
+            await asyncio.sleep(self.pump_interval)
+
+    async def physics(self):
+        sim = self.sim
+        while sim.simulation_active:
+            sim.advance_physics()
+            await asyncio.sleep(self.physics_interval)
+
+    async def render(self):
+        #  ╭──────────────────────────────────────────────────────╮
+        #  │ Draw a frame at every tick of the ideal frame clock. │
+        #  ╰──────────────────────────────────────────────────────╯
+        sim = self.sim
+        while sim.simulation_active:
+            now = time.perf_counter()
+            if sim.profiler:
+                sim.profiler.late(int((now - sim.next_frame) * 1e9))
+            sim.render()
+            sim.next_frame = max(sim.next_frame + sim.frame_interval, now)
+            await asyncio.sleep(max(sim.next_frame - time.perf_counter(), 0))
+
+    async def expire_trail(self):
+        while True:
+            self.sim.expire_trail()
+            await asyncio.sleep(0.1)
+
+    async def stats(self):
+        #  ╭──────────────────────────────────────────────────────────────────╮
+        #  │                                                                  │
+        #  │ Refresh the status text and offer the score to every sink, up to │
+        #  │ and including the final GAME OVER update.                        │
+        #  │                                                                  │
+        #  ╰──────────────────────────────────────────────────────────────────╯
+        while True:
+            running = self.sim.show_status()
+            stats = self.sim.stats()
+            for queue in self.queues:
+                if queue.full():
+                    queue.get_nowait()
+                queue.put_nowait(stats)
+            if not running:
+                return
+            await asyncio.sleep(self.stats_interval)
+
+    async def feed(self, sink, queue):
+        #  ╭───────────────────────────────────────────────────────────────────╮
+        #  │                                                                   │
+        #  │ Publish queued updates to one sink. A sink that fails is reported │
+        #  │ once and then skipped; the game carries on.                       │
+        #  │                                                                   │
+        #  ╰───────────────────────────────────────────────────────────────────╯
+        while True:
+            stats = await queue.get()
+            try:
+                await sink.publish(stats)
+            except OSError as error:
+                self.report(sink, error)
+                return
+
+    def report(self, sink, error):
+        print(f'Stats sink {type(sink).__name__} failed: {error}',
+              file=sys.stderr)
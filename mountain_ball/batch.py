@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+#  ╭──────────────────────────────────────────────────────────╮
+#  │ Scoring many terrains in parallel across a process pool. │
+#  ╰──────────────────────────────────────────────────────────╯
+
+import json
+import csv
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from .config import DEFAULTS
+from .engine import ENGINES
+
+#  ╭────────────────────────────────────────────────────────╮
+#  │ Engine reused by every job a batch worker process runs │
+#  ╰────────────────────────────────────────────────────────╯
+_worker_engine = None
+_worker_duration = 120
+
+def _init_worker(engine, duration, config=DEFAULTS):
+    #  ╭────────────────────────────────────────────────────────────────╮
+    #  │ Process pool initializer: build one engine per worker process. │
+    #  ╰────────────────────────────────────────────────────────────────╯
+    global _worker_engine, _worker_duration
+    _worker_engine = ENGINES[engine](config=config)
+    _worker_duration = duration
+
+def _score_job(job):
+    #  ╭──────────────────────────────────────────────────────────────────╮
+    #  │                                                                  │
+    #  │ Score one batch job: an int is a terrain seed, a str is the path │
+    #  │ of a terrain file. Runs in a worker process on its own engine.   │
+    #  │                                                                  │
+    #  ╰──────────────────────────────────────────────────────────────────╯
+    engine = _worker_engine
+    if isinstance(job, str):
+        engine.load_terrain(job)
+    else:
+        engine.reseed(job)
+    engine.run(_worker_duration)
+    score = engine.results()
+    return {'job': job, 'hits': score['hits'], 'time': score['time'],
+            'hpm': score['hpm']}
+
+class ResultWriter:
+    #  ╭─────────────────────────────────────────────────────────────────╮
+    #  │                                                                 │
+    #  │ Stream batch results to a CSV or JSON Lines file (picked by the │
+    #  │ file extension), one row per job as soon as it is scored.       │
+    #  │                                                                 │
+    #  ╰─────────────────────────────────────────────────────────────────╯
+    fields = ('job', 'hits', 'time', 'hpm')
+
+    def __init__(self, path):
+        self.file = open(path, 'w', newline='')
+        self.jsonl = path.endswith(('.jsonl', '.json'))
+        if not self.jsonl:
+            self.csv = csv.DictWriter(self.file, fieldnames=self.fields)
+            self.csv.writeheader()
+
+    def write(self, row):
+        if self.jsonl:
+            self.file.write(json.dumps(row) + '\n')
+        else:
+            self.csv.writerow(row)
+
+    def close(self):
+        self.file.close()
+
+def run_batch(jobs, duration=120, engine='event', workers=None,
+              chunksize=None, out=None, config=DEFAULTS):
+    #  ╭───────────────────────────────────────────────────────────────────╮
+    #  │                                                                   │
+    #  │ Score many terrains in parallel. `jobs` is a sequence of seeds    │
+    #  │ (ints) and/or terrain file paths (strs); they are handed to a     │
+    #  │ process pool in chunks, each worker reusing a single engine. By   │
+    #  │ default each worker gets about four chunks, so small batches      │
+    #  │ still spread over the pool. Results are streamed to `out` (CSV or │
+    #  │ JSONL) in job order and an aggregate summary is returned.         │
+    #  │                                                                   │
+    #  ╰───────────────────────────────────────────────────────────────────╯
+    jobs = list(jobs)
+    #  ╭────────────────────────────────────────────────────────────────╮
+    #  │ The endless engine generates its own terrain and ignores files │
+    #  ╰────────────────────────────────────────────────────────────────╯
+    if engine == 'endless' and any(isinstance(job, str) for job in jobs):
+        raise ValueError('the endless engine cannot score terrain files')
+    workers = workers or os.cpu_count() or 1
+    chunksize = chunksize or max(1, len(jobs) // (workers * 4))
+    writer = ResultWriter(out) if out else None
+    count = 0
+    total_hits = 0
+    total_hpm = 0.0
+    try:
+        with ProcessPoolExecutor(max_workers=workers,
+                                 initializer=_init_worker,
+                                 initargs=(engine, duration, config)) as pool:
+            for row in pool.map(_score_job, jobs, chunksize=chunksize):
+                if writer:
+                    writer.write(row)
+                count += 1
+                total_hits += row['hits']
+                total_hpm += row['hpm']
+    finally:
+        if writer:
+            writer.close()
+    return {
+        'jobs': count,
+        'hits_mean': total_hits / count if count else 0,
+        'hpm_mean': total_hpm / count if count else 0,
+    }
+
+def parse_seeds(spec):
+    #  ╭────────────────────────────────────────────────────────────────────╮
+    #  │ Parse a seed range "START:STOP" (STOP exclusive) or a single seed. │
+    #  ╰────────────────────────────────────────────────────────────────────╯
+    if ':' in spec:
+        start, stop = spec.split(':', 1)
+        return range(int(start), int(stop))
+    return [int(spec)]
@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+#  ╭────────────────────────────────────────────────────────────╮
+#  │ Benchmark suite, with baseline files to catch regressions. │
+#  ╰────────────────────────────────────────────────────────────╯
+
+import random
+import time
+import json
+import sys
+import platform
+
+from .engine import BallEngine, ENGINES
+from .trail import TrailBuffer
+
+def _best_time(fn, repeat=5):
+    #  ╭───────────────────────────────────────────────────────────╮
+    #  │ Run fn() `repeat` times and return the fastest wall time. │
+    #  ╰───────────────────────────────────────────────────────────╯
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def bench_step_rate(seed, seconds=30, engine='step'):
+    #  ╭──────────────────────────────────────────────────────────────╮
+    #  │ Physics steps per second of a fixed-step engine's core loop. │
+    #  ╰──────────────────────────────────────────────────────────────╯
+    engine = ENGINES[engine](seed=seed)
+    def run():
+        engine.reset()
+        engine.run(seconds)
+    steps = int(round(seconds / 0.001))
+    return steps / _best_time(run)
+
+def bench_collision(seed, width, calls=20000):
+    #  ╭───────────────────────────────────────────────────────────────────╮
+    #  │ Cost of one check_collision call (ns) on a terrain of `width` px. │
+    #  ╰───────────────────────────────────────────────────────────────────╯
+    engine = BallEngine(width=width, seed=seed)
+    rng = random.Random(seed)
+    positions = [[rng.uniform(0, width), rng.uniform(0, engine.height)]
+                 for _ in range(calls)]
+    def run():
+        for pos in positions:
+            engine.ball_pos = pos
+            engine.check_collision()
+    return _best_time(run) / calls * 1e9
+
+def bench_trail(dots):
+    #  ╭──────────────────────────────────────────────────────────────────╮
+    #  │ Cost (ns per dot) of adding `dots` trail dots and expiring them. │
+    #  ╰──────────────────────────────────────────────────────────────────╯
+    rounds = max(1, 100000 // dots)
+    def run():
+        for _ in range(rounds):
+            trail = TrailBuffer(range(dots), lifetime=5)
+            for i in range(dots):
+                trail.add(i * 0.01)
+            trail.expire(dots * 0.01 + 10)
+    return _best_time(run) / (dots * rounds) * 1e9
+
+def bench_game(seed, engine, duration=120):
+    #  ╭──────────────────────────────────────────────────────────╮
+    #  │ Simulated seconds per wall-clock second for a full game. │
+    #  ╰──────────────────────────────────────────────────────────╯
+    def run():
+        ENGINES[engine](seed=seed).run(duration)
+    return duration / _best_time(run, repeat=3)
+
+def run_benchmarks(seed=0, rounds=5):
+    #  ╭────────────────────────────────────────────────────────────────╮
+    #  │                                                                │
+    #  │ Run the whole benchmark suite with a fixed seed and return the │
+    #  │ results keyed by benchmark name. Each entry records its value, │
+    #  │ noise, unit and whether higher is better. Names depend only on │
+    #  │ the benchmark parameters, never on the terrain generated.      │
+    #  │                                                                │
+    #  ╰────────────────────────────────────────────────────────────────╯
+    #  ╭───────────────────────────────────────────────────────────────────╮
+    #  │                                                                   │
+    #  │ The suite is run `rounds` times over and each benchmark keeps its │
+    #  │ best round, so a slow spell on a busy machine hits one round of   │
+    #  │ every benchmark instead of every run of one. The noise is how far │
+    #  │ the median round is from the best, as a fraction of the best.     │
+    #  │                                                                   │
+    #  ╰───────────────────────────────────────────────────────────────────╯
+    suite = [
+        ('step_rate', lambda: bench_step_rate(seed), 'steps/s', True),
+        ('step_rate[lean]', lambda: bench_step_rate(seed, engine='lean'),
+         'steps/s', True),
+    ]
+    for width in (800, 8000, 80000):
+        suite.append((f'check_collision[{width} px]',
+                      lambda width=width: bench_collision(seed, width),
+                      'ns/call', False))
+    for dots in (100, 1000, 10000, 100000):
+        suite.append((f'trail[{dots} dots]',
+                      lambda dots=dots: bench_trail(dots), 'ns/dot', False))
+    for engine in sorted(ENGINES):
+        suite.append((f'game_120s[{engine}]',
+                      lambda engine=engine: bench_game(seed, engine),
+                      'sim s/wall s', True))
+
+    samples = {name: [] for name, _, _, _ in suite}
+    for _ in range(rounds):
+        for name, bench, _, _ in suite:
+            samples[name].append(bench())
+
+    results = {}
+    for name, _, unit, higher_is_better in suite:
+        values = sorted(samples[name], reverse=higher_is_better)
+        value = values[0]
+        noise = abs(values[len(values) // 2] - value) / value
+        results[name] = {'value': value, 'noise': noise, 'unit': unit,
+                         'higher_is_better': higher_is_better}
+        print(f'{name:<32} {value:>14,.1f} {unit}  (noise {noise:.0%})')
+    return results
+
+def save_benchmarks(results, path, seed=0):
+    #  ╭──────────────────────────────────────────────────────────────────╮
+    #  │                                                                  │
+    #  │ Write benchmark results plus machine details to a JSON file that │
+    #  │ later runs can be compared against.                              │
+    #  │                                                                  │
+    #  ╰──────────────────────────────────────────────────────────────────╯
+    with open(path, 'w') as f:
+        json.dump({
+            'seed': seed,
+            'python': sys.version.split()[0],
+            'platform': platform.platform(),
+            'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'results': results,
+        }, f, indent=2)
+
+def compare_benchmarks(results, path, seed=0):
+    #  ╭─────────────────────────────────────────────────────────────────╮
+    #  │                                                                 │
+    #  │ Print each benchmark's change against a saved baseline file.    │
+    #  │ Returns the names of the benchmarks that got worse by more than │
+    #  │ 10% plus the noise of both runs (at most 50% in all). Raises    │
+    #  │ ValueError if the baseline was run with another seed or the two │
+    #  │ runs do not have the same benchmarks.                           │
+    #  │                                                                 │
+    #  ╰─────────────────────────────────────────────────────────────────╯
+    with open(path) as f:
+        baseline = json.load(f)
+    if baseline['seed'] != seed:
+        raise ValueError(f"{path} was run with seed {baseline['seed']}, "
+                         f"not {seed}")
+    baseline = baseline['results']
+    mismatched = sorted(set(baseline) ^ set(results))
+    if mismatched:
+        raise ValueError(f"{path} does not have the same benchmarks: "
+                         f"{', '.join(mismatched)}")
+    regressions = []
+    for name, result in results.items():
+        old = baseline[name]['value']
+        new = result['value']
+        #  ╭────────────────────────────────────────────────────────────────╮
+        #  │ Speed-up factor: above 1 is better whichever way the unit goes │
+        #  ╰────────────────────────────────────────────────────────────────╯
+        factor = new / old if result['higher_is_better'] else old / new
+        tolerance = min(0.1 + baseline[name]['noise'] + result['noise'], 0.5)
+        mark = ''
+        if factor < 1 - tolerance:
+            mark = '  REGRESSION'
+            regressions.append(name)
+        print(f'{name:<32} {factor:>6.2f}x vs baseline '
+              f'(tolerance {tolerance:.0%}){mark}')
+    return regressions
@@ -0,0 +1,370 @@
+# -*- coding: utf-8 -*-
+#  ╭──────────────────────────────────────────────────────────────────────╮
+#  │                                                                      │
+#  │ Command line front end. Each subcommand imports only the modules it  │
+#  │ runs, so headless, batch, sweep, bench and replay runs start without │
+#  │ loading Tk, asyncio or NumPy.                                        │
+#  │                                                                      │
+#  ╰──────────────────────────────────────────────────────────────────────╯
+
+import argparse
+import sys
+
+from .config import GameConfig, DEFAULTS
+from .engine import ENGINES
+
+COMMANDS = ('gui', 'headless', 'batch', 'sweep', 'bench', 'record', 'replay')
+
+def run_gui(args):
+    import tkinter as tk
+    from .gui import BallSimulation, EndlessSimulation, MultiBallSimulation
+    #  ╭──────────────────────────────────────────╮
+    #  │ Create main window and remove its border │
+    #  ╰──────────────────────────────────────────╯
+    root = tk.Tk()
+    root.overrideredirect(True)
+    #  ╭───────────────────────────────────╮
+    #  │ Set window position to (100, 200) │
+    #  ╰───────────────────────────────────╯
+    root.geometry("+100+200")
+    #  ╭────────────────────────────╮
+    #  │ Instantiate the simulation │
+    #  ╰────────────────────────────╯
+    options = dict(fps=args.fps, engine=args.engine, seed=args.seed,
+                   trail_capacity=args.trail, profile=args.profile,
+                   render=args.render, start=args.loop == 'tk',
+                   config=args.config)
+    if args.balls > 1:
+        sim = MultiBallSimulation(root, balls=args.balls, **options)
+    elif args.engine == 'endless':
+        sim = EndlessSimulation(root, **options)
+    else:
+        sim = BallSimulation(root, **options)
+    #  ╭─────────────────────────────────────────────────────────────╮
+    #  │ Start the Tkinter main loop, or the asyncio loop pumping Tk │
+    #  ╰─────────────────────────────────────────────────────────────╯
+    if args.loop == 'asyncio':
+        from .async_loop import AsyncGameLoop
+        AsyncGameLoop(sim, args.stats).run()
+    else:
+        root.mainloop()
+
+def run_headless_game(args):
+    #  ╭──────────────────────────────────────────────────╮
+    #  │ Simulate as fast as possible and print the score │
+    #  ╰──────────────────────────────────────────────────╯
+    if args.balls > 1:
+        from .vector import run_monte_carlo
+        score = run_monte_carlo(args.balls, args.duration, args.seed,
+                                args.config)
+        print(f"Balls: {score['balls']}  Time: {score['time']:.1f} s  "
+              f"Hits: {score['hits_mean']:.1f} +/- {score['hits_std']:.1f}  "
+              f"HPM: {score['hpm']:.1f}")
+        return
+    from .engine import run_headless
+    score = run_headless(args.duration, args.engine, args.seed, args.config)
+    print(f"Hits: {score['hits']}  Time: {score['time']:.1f} s  "
+          f"HPM: {score['hpm']:.1f}")
+    if 'distance' in score:
+        print(f"Distance: {score['distance']:.0f} px")
+
+def run_batch_games(args):
+    from .batch import run_batch, parse_seeds
+    jobs = list(parse_seeds(args.seeds)) if args.seeds else []
+    jobs += args.terrains or []
+    summary = run_batch(jobs, args.duration, args.engine, args.workers,
+                        args.chunksize, args.out, args.config)
+    print(f"Jobs: {summary['jobs']}  Hits: {summary['hits_mean']:.2f}  "
+          f"HPM: {summary['hpm_mean']:.2f}")
+
+def run_sweep_search(args):
+    from .batch import parse_seeds
+    from .sweep import sweep_candidates, run_sweep
+    candidates = sweep_candidates(args.space, args.search, args.samples,
+                                  args.seed, args.config)
+    def progress(seed, configs, simulated):
+        print(f'Seed {seed}: {configs} configs, {simulated} simulated',
+              flush=True)
+    ranking = run_sweep(candidates, list(parse_seeds(args.seeds)),
+                        args.duration, args.engine, args.workers, args.prune,
+                        args.cache, progress)
+    for hpm, config, seeds in ranking[:10]:
+        values = '  '.join(f'{name}={getattr(config, name):g}'
+                           for name in args.space)
+        print(f'HPM: {hpm:8.2f}  Seeds: {seeds}  {values}')
+    if args.out and ranking:
+        ranking[0][1].save(args.out)
+
+def run_bench(args):
+    #  ╭─────────────────────────────────────────────────────╮
+    #  │ Exit status 1 if anything regressed vs the baseline │
+    #  ╰─────────────────────────────────────────────────────╯
+    from .bench import run_benchmarks, save_benchmarks, compare_benchmarks
+    results = run_benchmarks(args.seed)
+    if args.out:
+        save_benchmarks(results, args.out, args.seed)
+    if args.baseline:
+        try:
+            regressions = compare_benchmarks(results, args.baseline,
+                                             args.seed)
+        except (OSError, KeyError, ValueError) as error:
+            sys.exit(f'Cannot compare with the baseline: {error}')
+        if regressions:
+            sys.exit(1)
+
+def run_record(args):
+    from .replay import record_headless
+    try:
+        score = record_headless(args.file, args.duration, args.seed,
+                                config=args.config)
+    except (OSError, ValueError) as error:
+        sys.exit(f'Cannot record: {error}')
+    print(f"Hits: {score['hits']}  Time: {score['time']:.1f} s  "
+          f"HPM: {score['hpm']:.1f}")
+
+def run_replay(args):
+    #  ╭────────────────────────────────────────────────╮
+    #  │ Seek into a trajectory log and audit its score │
+    #  ╰────────────────────────────────────────────────╯
+    from .replay import Replay
+    try:
+        replay = Replay(args.file)
+    except (OSError, ValueError) as error:
+        sys.exit(f'Cannot replay: {error}')
+    print(f"Seed: {replay.seed}  Events: {len(replay)}  "
+          f"Duration: {replay.duration:.1f} s")
+    for t in args.at:
+        state = replay.state_at(t)
+        print(f"t={state['time']:.3f}  x={state['x']:.2f}  "
+              f"y={state['y']:.2f}  vx={state['vx']:.2f}  "
+              f"vy={state['vy']:.2f}  Hits: {state['hits']}")
+    print('Verified' if replay.verify() else 'MISMATCH')
+    replay.close()
+
+def legacy_argv(argv):
+    #  ╭───────────────────────────────────────────────────────────────────╮
+    #  │                                                                   │
+    #  │ Rewrite the old single-command flags (--headless, --bench,        │
+    #  │ --batch, --terrains, --sweep, --record, --replay) as the matching │
+    #  │ subcommand, so existing scripts keep working. Without any of them │
+    #  │ the game window opens, as before.                                 │
+    #  │                                                                   │
+    #  ╰───────────────────────────────────────────────────────────────────╯
+    tokens = []
+    for token in argv:
+        if token.startswith('--') and '=' in token:
+            tokens += token.split('=', 1)
+        else:
+            tokens.append(token)
+    tokens = ['--seeds' if token == '--sweep-seeds' else token
+              for token in tokens]
+    for flag in ('--bench', '--replay', '--sweep', '--batch', '--terrains',
+                 '--record', '--headless'):
+        if flag in tokens:
+            break
+    else:
+        return ['gui'] + tokens
+    i = tokens.index(flag)
+    if flag in ('--bench', '--headless'):
+        return [flag[2:]] + tokens[:i] + tokens[i + 1:]
+    if flag in ('--replay', '--record'):
+        return [flag[2:]] + tokens[i + 1:i + 2] + tokens[:i] + tokens[i + 2:]
+    if flag == '--sweep':
+        end = i + 1
+        while end < len(tokens) and not tokens[end].startswith('-'):
+            end += 1
+        return ['sweep'] + tokens[i + 1:end] + tokens[:i] + tokens[end:]
+    if flag == '--batch':
+        tokens[i] = '--seeds'
+    return ['batch'] + tokens
+
+def parse_args(argv=None):
+    #  ╭─────────────────────────────────╮
+    #  │ Parse the command line options. │
+    #  ╰─────────────────────────────────╯
+    argv = sys.argv[1:] if argv is None else list(argv)
+    if not argv or (argv[0] not in COMMANDS
+                    and argv[0] not in ('-h', '--help')):
+        argv = legacy_argv(argv)
+
+    #  ╭───────────────────────────────────────╮
+    #  │ Options shared by several subcommands │
+    #  ╰───────────────────────────────────────╯
+    seeded = argparse.ArgumentParser(add_help=False)
+    seeded.add_argument('--seed', type=int,
+                        help='seed for the terrain and ball colors')
+    configured = argparse.ArgumentParser(add_help=False)
+    configured.add_argument('--config', metavar='FILE',
+                            help='play with the gravity, bounce and terrain '
+                                 'settings in this JSON file (see sweep)')
+    timed = argparse.ArgumentParser(add_help=False)
+    timed.add_argument('--duration', type=float, default=120,
+                       help='simulated seconds per game (default 120)')
+    pooled = argparse.ArgumentParser(add_help=False)
+    pooled.add_argument('--workers', type=int,
+                        help='worker processes (default: one per CPU)')
+
+    def engine_option(subparser, default):
+        #  ╭─────────────────────────────────────────────────────────────────╮
+        #  │                                                                 │
+        #  │ The parsed default is None, so an explicit --engine can be told │
+        #  │ apart; engine_default fills it in once the options are checked  │
+        #  │                                                                 │
+        #  ╰─────────────────────────────────────────────────────────────────╯
+        subparser.set_defaults(engine_default=default)
+        subparser.add_argument('--engine', choices=sorted(ENGINES),
+                               help='physics engine: fixed 1 ms steps, the '
+                                    'same steps in a faster inlined loop '
+                                    '(lean), exact event-driven, or fixed '
+                                    'steps over endless side-scrolling '
+                                    f'terrain (default {default})')
+
+    parser = argparse.ArgumentParser(
+        description='Ball Simulation Game',
+        epilog='Without a command the game window opens; the old '
+               '--headless, --bench, --batch, --sweep, --record and '
+               '--replay flags are still accepted.')
+    commands = parser.add_subparsers(dest='command', metavar='COMMAND')
+
+    gui = commands.add_parser('gui', parents=[seeded, configured],
+                              help='play in a game window (default)')
+    gui.set_defaults(run=run_gui)
+    engine_option(gui, 'step')
+    gui.add_argument('--balls', type=int, default=1,
+                     help='number of colliding balls, with their own '
+                          'physics (not with --engine; default 1)')
+    gui.add_argument('--trail', type=int, default=1024,
+                     help='maximum number of trail dots on screen, 0 for '
+                          'no trail (default 1024)')
+    gui.add_argument('--fps', type=float, default=60,
+                     help='render rate of the game window (default 60)')
+    gui.add_argument('--render', choices=('items', 'image'),
+                     default='items',
+                     help='draw with one canvas item per ball and trail dot, '
+                          'or compose each frame into a single image with '
+                          'fading trails (needs NumPy; not with endless)')
+    gui.add_argument('--loop', choices=('tk', 'asyncio'), default='tk',
+                     help='drive the game window with Tk timers or with '
+                          'asyncio coroutines (default tk)')
+    gui.add_argument('--stats', action='append', default=[], metavar='SINK',
+                     help='with --loop asyncio, publish the score to '
+                          'udp:HOST:PORT, unix:PATH or [file:]PATH '
+                          '(repeatable)')
+    gui.add_argument('--profile', nargs='?', const='profile.json',
+                     metavar='FILE',
+                     help='show per-phase frame timings and write p50/p95/p99 '
+                          'histograms to FILE on exit (default profile.json)')
+
+    headless = commands.add_parser('headless',
+                                   parents=[seeded, configured, timed],
+                                   help='play a game without a display and '
+                                        'print the score')
+    headless.set_defaults(run=run_headless_game)
+    engine_option(headless, 'step')
+    headless.add_argument('--balls', type=int, default=1,
+                          help='independent balls for a Monte Carlo run '
+                               '(needs NumPy; not with --engine; default 1)')
+
+    batch = commands.add_parser('batch', parents=[configured, timed, pooled],
+                                help='score many terrains across a process '
+                                     'pool')
+    batch.set_defaults(run=run_batch_games)
+    engine_option(batch, 'event')
+    batch.add_argument('--seeds', metavar='START:STOP',
+                       help='score every terrain seed in the range')
+    batch.add_argument('--terrains', nargs='+', metavar='FILE',
+                       help='score these terrain files')
+    batch.add_argument('--chunksize', type=int,
+                       help='jobs handed to a worker at a time (default: '
+                            'about four chunks per worker)')
+    batch.add_argument('--out', metavar='FILE',
+                       help='stream results to a .csv or .jsonl file')
+
+    sweep = commands.add_parser('sweep',
+                                parents=[seeded, configured, timed, pooled],
+                                help='search config values for the highest '
+                                     'HPM across a process pool')
+    sweep.set_defaults(run=run_sweep_search)
+    engine_option(sweep, 'event')
+    sweep.add_argument('space', nargs='+', metavar='FIELD=VALUES',
+                       help='values to search, LO:HI[:N] or A,B,...; '
+                            'fields: ' + ', '.join(GameConfig.fields))
+    sweep.add_argument('--search', choices=('grid', 'random'),
+                       default='grid',
+                       help='try every grid combination or random draws '
+                            '(default grid)')
+    sweep.add_argument('--samples', type=int, default=32,
+                       help='configs drawn by a random search (default 32)')
+    sweep.add_argument('--seeds', default='0:5', metavar='START:STOP',
+                       help='terrain seeds each config is played on, one '
+                            'round per seed (default 0:5)')
+    sweep.add_argument('--prune', type=float, default=0.5,
+                       help='after each round, drop configs whose mean HPM '
+                            'is below this fraction of the best (default 0.5)')
+    sweep.add_argument('--cache', default='sweep-cache.jsonl', metavar='FILE',
+                       help='results cache (default sweep-cache.jsonl)')
+    sweep.add_argument('--out', metavar='FILE',
+                       help='save the best config for --config')
+
+    bench = commands.add_parser('bench', help='run the benchmark suite')
+    bench.set_defaults(run=run_bench)
+    bench.add_argument('--seed', type=int, default=0,
+                       help='terrain seed for the benchmarks (default 0)')
+    bench.add_argument('--out', metavar='FILE',
+                       help='save the results as JSON')
+    bench.add_argument('--baseline', metavar='FILE',
+                       help='compare the results against a saved run')
+
+    record = commands.add_parser('record',
+                                 parents=[seeded, configured, timed],
+                                 help='record a headless game (event engine) '
+                                      'to a binary trajectory log')
+    record.set_defaults(run=run_record)
+    record.add_argument('file', metavar='FILE')
+
+    replay = commands.add_parser('replay',
+                                 help='print the ball state from a trajectory '
+                                      'log and verify its score')
+    replay.set_defaults(run=run_replay)
+    replay.add_argument('file', metavar='FILE')
+    replay.add_argument('--at', type=float, nargs='+', default=[],
+                        metavar='SECONDS', help='times to show')
+
+    args = parser.parse_args(argv)
+    if args.command is None:
+        parser.error('a command is required')
+    if args.command in ('gui', 'headless'):
+        if args.balls > 1 and args.engine:
+            parser.error('--engine does not apply to more than one ball')
+    if 'engine' in args and args.engine is None:
+        args.engine = args.engine_default
+    if args.command == 'gui':
+        if args.render == 'image' and args.engine == 'endless':
+            parser.error('--render image does not support the endless engine')
+        if args.stats and args.loop != 'asyncio':
+            parser.error('--stats needs --loop asyncio')
+        if args.trail < 0:
+            parser.error('--trail cannot be negative')
+    if args.command == 'batch':
+        if not (args.seeds or args.terrains):
+            parser.error('batch needs --seeds or --terrains')
+        if args.terrains and args.engine == 'endless':
+            parser.error('--terrains does not support the endless engine')
+    try:
+        if 'config' in args:
+            args.config = (GameConfig.load(args.config) if args.config
+                           else DEFAULTS)
+        if args.command == 'sweep':
+            from .sweep import parse_space
+            args.space = parse_space(args.space)
+        if args.command == 'gui' and args.stats:
+            from .async_loop import parse_sink
+            args.stats = [parse_sink(spec) for spec in args.stats]
+    except (OSError, TypeError, ValueError) as error:
+        parser.error(str(error))
+    return args
+
+def main(argv=None):
+    args = parse_args(argv)
+    args.run(args)
+
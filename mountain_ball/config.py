@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+#  ╭─────────────────────────────────────────────────────────────╮
+#  │ Game tunables shared by the engines and terrain generators. │
+#  ╰─────────────────────────────────────────────────────────────╯
+
+import json
+
+class GameConfig:
+    #  ╭────────────────────────────────────────────────────────────────────╮
+    #  │                                                                    │
+    #  │ The tunables that set how the game plays: gravity, the damping of  │
+    #  │ wall bounces, the horizontal/vertical restitution of terrain       │
+    #  │ bounces, and the terrain's height band and point spacing (pixels). │
+    #  │ Engines and terrain generators take one as `config`; treat it as   │
+    #  │ read-only and derive variants with replace().                      │
+    #  │                                                                    │
+    #  ╰────────────────────────────────────────────────────────────────────╯
+    fields = ('gravity', 'wall_damping', 'restitution_x', 'restitution_y',
+              'terrain_band', 'spacing_min', 'spacing_max')
+    #  ╭────────────────────────────────────╮
+    #  │ Fields that only take whole pixels │
+    #  ╰────────────────────────────────────╯
+    integer_fields = ('terrain_band', 'spacing_min', 'spacing_max')
+
+    def __init__(self, gravity=300.0, wall_damping=0.8, restitution_x=1.1,
+                 restitution_y=0.95, terrain_band=120, spacing_min=15,
+                 spacing_max=28):
+        self.gravity = float(gravity)
+        self.wall_damping = float(wall_damping)
+        self.restitution_x = float(restitution_x)
+        self.restitution_y = float(restitution_y)
+        self.terrain_band = int(round(terrain_band))
+        self.spacing_min = int(round(spacing_min))
+        self.spacing_max = int(round(spacing_max))
+        if not 0 < self.spacing_min <= self.spacing_max:
+            raise ValueError('terrain spacing needs 0 < spacing_min <= '
+                             'spacing_max')
+        if self.terrain_band < 0:
+            raise ValueError('terrain_band cannot be negative')
+
+    def as_dict(self):
+        return {name: getattr(self, name) for name in self.fields}
+
+    def replace(self, **changes):
+        #  ╭──────────────────────────────────────────────╮
+        #  │ Return a copy with the given fields changed. │
+        #  ╰──────────────────────────────────────────────╯
+        return GameConfig(**{**self.as_dict(), **changes})
+
+    def __eq__(self, other):
+        return isinstance(other, GameConfig) and \
+            self.as_dict() == other.as_dict()
+
+    def __hash__(self):
+        return hash(tuple(self.as_dict().values()))
+
+    def __repr__(self):
+        values = ', '.join(f'{k}={v!r}' for k, v in self.as_dict().items())
+        return f'GameConfig({values})'
+
+    @classmethod
+    def load(cls, path):
+        #  ╭───────────────────────────────────────────────────╮
+        #  │ Read a config from a JSON object of field values. │
+        #  ╰───────────────────────────────────────────────────╯
+        with open(path) as f:
+            return cls(**json.load(f))
+
+    def save(self, path):
+        with open(path, 'w') as f:
+            json.dump(self.as_dict(), f, indent=2)
+
+#  ╭──────────────────────────────╮
+#  │ The game as originally tuned │
+#  ╰──────────────────────────────╯
+DEFAULTS = GameConfig()
@@ -0,0 +1,1092 @@
+# -*- coding: utf-8 -*-
+#  ╭───────────────────────────────────────────────────────────────────╮
+#  │                                                                   │
+#  │ Physics engines. None of them needs Tk, so games can be simulated │
+#  │ and scored without a display.                                     │
+#  │                                                                   │
+#  ╰───────────────────────────────────────────────────────────────────╯
+
+import random
+import math
+import json
+from bisect import bisect_left
+
+from .config import DEFAULTS
+from .terrain import generate_terrain, TerrainIndex, ChunkedTerrain
+
+class BallEngine:
+    #  ╭─────────────────────────────────────────────────────────────────────╮
+    #  │                                                                     │
+    #  │ Pure physics core of the game: ball state, terrain and the step     │
+    #  │ logic. It has no Tk dependency and steps as fast as the CPU allows, │
+    #  │ so a full game can be scored headlessly in a fraction of a second.  │
+    #  │                                                                     │
+    #  ╰─────────────────────────────────────────────────────────────────────╯
+    def __init__(self, width=800, height=300, seed=None, config=DEFAULTS):
+        #  ╭────────────────────────────────────────────────────────────╮
+        #  │                                                            │
+        #  │ Define playfield dimensions (same as the canvas); a loaded │
+        #  │ terrain file may change them until the next reseed         │
+        #  │                                                            │
+        #  ╰────────────────────────────────────────────────────────────╯
+        self.width = width
+        self.height = height
+        self.size = (width, height)
+        #  ╭──────────────────────────────────────╮
+        #  │ Gravity, bounce and terrain tunables │
+        #  ╰──────────────────────────────────────╯
+        self.config = config
+        #  ╭──────────────────────────────────────────────────╮
+        #  │ Ball radius (4 pixel radius = 8 pixels diameter) │
+        #  ╰──────────────────────────────────────────────────╯
+        self.ball_radius = 4
+        #  ╭───────────────────────────────────────────────╮
+        #  │ Time step for physics simulation (in seconds) │
+        #  ╰───────────────────────────────────────────────╯
+        self.time_step = 0.001
+        #  ╭───────────────────────────────────────────────────────────╮
+        #  │ Per-simulation random generator, so runs are reproducible │
+        #  ╰───────────────────────────────────────────────────────────╯
+        self.seed = seed
+        self.rng = random.Random(seed)
+
+        #  ╭───────────────────────────────────────────────────╮
+        #  │ Create the terrain at the bottom of the playfield │
+        #  ╰───────────────────────────────────────────────────╯
+        self.create_terrain()
+        #  ╭─────────────────────────────────────────────────────────╮
+        #  │ Put the ball at the top centre and zero the hit counter │
+        #  ╰─────────────────────────────────────────────────────────╯
+        self.reset()
+
+    def reset(self):
+        #  ╭────────────────────────────────────────────────────────────╮
+        #  │                                                            │
+        #  │ Restore the ball and the score to the start-of-game state, │
+        #  │ keeping the current terrain.                               │
+        #  │                                                            │
+        #  ╰────────────────────────────────────────────────────────────╯
+        #  ╭───────────────────────────────────────────────────────────╮
+        #  │ Initialize hit counter (starts at -1 to offset first hit) │
+        #  ╰───────────────────────────────────────────────────────────╯
+        self.counter = -1
+        #  ╭─────────────────────────────────────────────────────────────╮
+        #  │ Number of physics steps taken (simulated time = steps * dt) │
+        #  ╰─────────────────────────────────────────────────────────────╯
+        self.steps = 0
+
+        #  ╭─────────────────────────────────────────────────────────────────╮
+        #  │ Set up physics parameters: position, velocity, and acceleration │
+        #  ╰─────────────────────────────────────────────────────────────────╯
+        self.ball_pos = [self.width/2, 0]
+        self.ball_vel = [0.0, 0.0]
+        self.ball_acc = [0.0, self.config.gravity]
+        #  ╭────────────────╮
+        #  │ Gravity effect │
+        #  ╰────────────────╯
+
+    @property
+    def elapsed(self):
+        #  ╭────────────────────────────╮
+        #  │ Simulated time in seconds. │
+        #  ╰────────────────────────────╯
+        return self.steps * self.time_step
+
+    def create_terrain(self):
+        #  ╭────────────────────────────────────────────────────────╮
+        #  │ Generate the terrain along the bottom of the playfield │
+        #  ╰────────────────────────────────────────────────────────╯
+        self.set_terrain(generate_terrain(self.width, self.height, self.rng,
+                                          self.config))
+
+    def set_terrain(self, points):
+        #  ╭──────────────────────────────────────────────────────────────╮
+        #  │ Use the given closed terrain polygon as the playfield floor. │
+        #  ╰──────────────────────────────────────────────────────────────╯
+        self.terrain_points = points
+        #  ╭────────────────────────────────────────────────────────────────╮
+        #  │ Index the surface (without the closing edges) for fast lookups │
+        #  ╰────────────────────────────────────────────────────────────────╯
+        self.terrain_index = TerrainIndex(self.terrain_points[:-2])
+
+    def reseed(self, seed):
+        #  ╭─────────────────────────────────────────────────────────────────╮
+        #  │                                                                 │
+        #  │ Start a fresh game on the terrain generated from `seed`, on the │
+        #  │ playfield size the engine was built with.                       │
+        #  │                                                                 │
+        #  ╰─────────────────────────────────────────────────────────────────╯
+        self.width, self.height = self.size
+        self.seed = seed
+        self.rng.seed(seed)
+        self.create_terrain()
+        self.reset()
+
+    def save_terrain(self, path):
+        #  ╭──────────────────────────────────────────────────────────────╮
+        #  │ Write the playfield size and terrain polygon to a JSON file. │
+        #  ╰──────────────────────────────────────────────────────────────╯
+        with open(path, 'w') as f:
+            json.dump({'width': self.width, 'height': self.height,
+                       'terrain_points': self.terrain_points}, f)
+
+    def load_terrain(self, path):
+        #  ╭──────────────────────────────────────────────────────────╮
+        #  │ Start a fresh game on a terrain saved with save_terrain. │
+        #  ╰──────────────────────────────────────────────────────────╯
+        with open(path) as f:
+            data = json.load(f)
+        self.width = data['width']
+        self.height = data['height']
+        self.seed = None
+        self.set_terrain([tuple(p) for p in data['terrain_points']])
+        self.reset()
+
+    def step(self):
+        #  ╭─────────────────────────────────────────────────────────────╮
+        #  │                                                             │
+        #  │ Advance the simulation by one time step.                    │
+        #  │ Returns True if the ball hit the top wall during this step. │
+        #  │                                                             │
+        #  ╰─────────────────────────────────────────────────────────────╯
+        #  ╭───────────────────────────────────────────────╮
+        #  │ Update velocity and position based on physics │
+        #  ╰───────────────────────────────────────────────╯
+        self.ball_vel[1] += self.ball_acc[1] * self.time_step
+        self.ball_pos[0] += self.ball_vel[0] * self.time_step
+        self.ball_pos[1] += self.ball_vel[1] * self.time_step
+
+        #  ╭────────────────────────────────────────────╮
+        #  │ Check for collisions with the window walls │
+        #  ╰────────────────────────────────────────────╯
+        hit = self.check_wall_collision()
+        #  ╭──────────────────────────────────╮
+        #  │ Check for collision with terrain │
+        #  ╰──────────────────────────────────╯
+        if self.check_collision():
+            self.resolve_collision()
+
+        self.steps += 1
+        return hit
+
+    def run(self, seconds):
+        #  ╭────────────────────────────────────────────────────────╮
+        #  │                                                        │
+        #  │ Step the simulation for the given number of simulated  │
+        #  │ seconds, as fast as possible. Returns the hit counter. │
+        #  │                                                        │
+        #  ╰────────────────────────────────────────────────────────╯
+        for _ in range(int(round(seconds / self.time_step))):
+            self.step()
+        return self.counter
+
+    def results(self):
+        #  ╭─────────────────────────────────────────────────────────╮
+        #  │ Return the score of the run so far: hits, time and HPM. │
+        #  ╰─────────────────────────────────────────────────────────╯
+        run_time = self.elapsed
+        hpm = (self.counter / run_time * 60) if run_time > 0 else 0
+        return {'hits': self.counter, 'time': run_time, 'hpm': hpm}
+
+    def check_wall_collision(self):
+        #  ╭────────────────────────────────────────────────────────╮
+        #  │                                                        │
+        #  │ Detect collisions with the left, right, and top walls. │
+        #  │ If the ball hits the top wall, update the hit counter. │
+        #  │ Returns True if the top wall was hit.                  │
+        #  │                                                        │
+        #  │ Left wall collision                                    │
+        #  │                                                        │
+        #  ╰────────────────────────────────────────────────────────╯
+        if self.ball_pos[0] - self.ball_radius <= 0:
+            self.ball_pos[0] = self.ball_radius
+            self.ball_vel[0] = -self.ball_vel[0] * self.config.wall_damping
+        #  ╭──────────────────────╮
+        #  │ Right wall collision │
+        #  ╰──────────────────────╯
+        elif self.ball_pos[0] + self.ball_radius >= self.width:
+            self.ball_pos[0] = self.width - self.ball_radius
+            self.ball_vel[0] = -self.ball_vel[0] * self.config.wall_damping
+
+        #  ╭──────────────────────────────────╮
+        #  │ Top wall collision: count as hit │
+        #  ╰──────────────────────────────────╯
+        if self.ball_pos[1] - self.ball_radius <= 0:
+            self.ball_pos[1] = self.ball_radius
+            self.ball_vel[1] = -self.ball_vel[1] * self.config.wall_damping
+            #  ╭───────────────────────╮
+            #  │ Increment hit counter │
+            #  ╰───────────────────────╯
+            self.increment_counter()
+            return True
+        return False
+
+    def increment_counter(self):
+        #  ╭───────────────────────────────────╮
+        #  │ Increment the hit counter by one. │
+        #  ╰───────────────────────────────────╯
+        self.counter += 1
+
+    def check_collision(self):
+        #  ╭──────────────────────────────────────────────╮
+        #  │                                              │
+        #  │ Check if the ball collides with the terrain. │
+        #  │ Returns True if collision occurs.            │
+        #  │                                              │
+        #  ╰──────────────────────────────────────────────╯
+        x, y = self.ball_pos
+        #  ╭─────────────────────────────────────────────╮
+        #  │ Find the terrain segment under the ball's x │
+        #  ╰─────────────────────────────────────────────╯
+        index = self.terrain_index
+        i = index.segment_at(x)
+        if i < 0:
+            return False
+        #  ╭─────────────────────────────────────╮
+        #  │ Check if ball overlaps with terrain │
+        #  ╰─────────────────────────────────────╯
+        if y + self.ball_radius >= index.slopes[i] * x + index.intercepts[i]:
+            self.collision_terrain = index
+            self.collision_segment = i
+            return True
+        return False
+
+    def resolve_collision(self):
+        #  ╭────────────────────────────────────────────────────────────╮
+        #  │                                                            │
+        #  │ Reflect the ball's velocity based on the terrain's         │
+        #  │ normal vector and adjust for slight energy loss.           │
+        #  │ The segment hit is collision_segment of collision_terrain. │
+        #  │                                                            │
+        #  ╰────────────────────────────────────────────────────────────╯
+        index = self.collision_terrain
+        i = self.collision_segment
+        #  ╭──────────────────────────────────────────────────────────────╮
+        #  │ Look up the precomputed normal vector of the terrain segment │
+        #  ╰──────────────────────────────────────────────────────────────╯
+        nx = index.nx[i]
+        ny = index.ny[i]
+        #  ╭───────────────────────────────────────────────────╮
+        #  │ Compute dot product of velocity and normal vector │
+        #  ╰───────────────────────────────────────────────────╯
+        v_dot_n = self.ball_vel[0] * nx + self.ball_vel[1] * ny
+        #  ╭─────────────────────────────╮
+        #  │ Reflect the velocity vector │
+        #  ╰─────────────────────────────╯
+        self.ball_vel[0] -= 2 * v_dot_n * nx
+        self.ball_vel[1] -= 2 * v_dot_n * ny
+        #  ╭─────────────────────────────────╮
+        #  │ Apply slight energy adjustments │
+        #  ╰─────────────────────────────────╯
+        self.ball_vel[0] *= self.config.restitution_x
+        self.ball_vel[1] *= self.config.restitution_y
+
+        #  ╭──────────────────────────────────────────────────────────────────╮
+        #  │                                                                  │
+        #  │ Adjust ball position to prevent sinking into terrain (a vertical │
+        #  │ segment has slope 0, leaving its top y)                          │
+        #  │                                                                  │
+        #  ╰──────────────────────────────────────────────────────────────────╯
+        x, y = self.ball_pos
+        y_terrain = index.slopes[i] * (x - index.xs[i]) + index.ys[i]
+        overlap = (y + self.ball_radius) - y_terrain
+        if overlap > 0:
+            self.ball_pos[1] -= overlap
+
+def entry_time(a, b, c):
+    #  ╭───────────────────────────────────────────────────────────────────╮
+    #  │                                                                   │
+    #  │ Return the time at which the gap function f(t) = a*t^2 + b*t + c  │
+    #  │ crosses zero while increasing (the ball moving into an obstacle), │
+    #  │ or None if it never does. Negative results are in the past.       │
+    #  │                                                                   │
+    #  ╰───────────────────────────────────────────────────────────────────╯
+    if a == 0:
+        if b > 0:
+            return -c / b
+        return None
+    disc = b * b - 4 * a * c
+    #  ╭─────────────────────────────────────────────────────╮
+    #  │ No real roots, or a tangent touch that never enters │
+    #  ╰─────────────────────────────────────────────────────╯
+    if disc <= 0:
+        return None
+    #  ╭──────────────────────────────────────────────────────────────────╮
+    #  │                                                                  │
+    #  │ The entering root is the one where f'(t) = +sqrt(disc); pick the │
+    #  │ numerically stable form depending on the sign of b               │
+    #  │                                                                  │
+    #  ╰──────────────────────────────────────────────────────────────────╯
+    root = math.sqrt(disc)
+    if b <= 0:
+        return (root - b) / (2 * a)
+    return (2 * c) / (-b - root)
+
+class EventEngine(BallEngine):
+    #  ╭─────────────────────────────────────────────────────────────────────╮
+    #  │                                                                     │
+    #  │ Event-driven variant of BallEngine. Between collisions the ball     │
+    #  │ follows an exact parabola under ball_acc, so instead of integrating │
+    #  │ every 1 ms the engine solves for the time of the next impact with   │
+    #  │ the walls, the ceiling or a terrain segment, jumps straight there   │
+    #  │ and applies the same bounce rules as the step engine. A game costs  │
+    #  │ a few hundred events instead of 120,000 steps, and fast balls       │
+    #  │ cannot tunnel through steep segments.                               │
+    #  │                                                                     │
+    #  ╰─────────────────────────────────────────────────────────────────────╯
+    #  ╭─────────────────────────────────────────────────────────╮
+    #  │ Optional Recorder told about every event (see Recorder) │
+    #  ╰─────────────────────────────────────────────────────────╯
+    recorder = None
+
+    def reset(self):
+        super().reset()
+        #  ╭────────────────────────────────────────────────────────╮
+        #  │ Continuous simulated time and number of events handled │
+        #  ╰────────────────────────────────────────────────────────╯
+        self.time = 0.0
+        self.events = 0
+        #  ╭─────────────────────────────────────────────────────────────────╮
+        #  │                                                                 │
+        #  │ Impacts closer together than two steps count as contact (a ball │
+        #  │ wedged in a corner bounces about once per step, either side of  │
+        #  │ the step length); contact ends after ten steps touching nothing │
+        #  │                                                                 │
+        #  ╰─────────────────────────────────────────────────────────────────╯
+        self.min_event_dt = 2 * self.time_step
+        self.short_events = 0
+        self.quiet_steps = 0
+
+    @property
+    def elapsed(self):
+        #  ╭────────────────────────────╮
+        #  │ Simulated time in seconds. │
+        #  ╰────────────────────────────╯
+        return self.time
+
+    def next_event(self, horizon):
+        #  ╭─────────────────────────────────────────────────────────────────╮
+        #  │                                                                 │
+        #  │ Find the earliest impact within `horizon` seconds.              │
+        #  │ Returns (time, kind, segment) with kind one of 'left', 'right', │
+        #  │ 'top' or 'terrain', or None if the ball flies freely.           │
+        #  │                                                                 │
+        #  ╰─────────────────────────────────────────────────────────────────╯
+        x0, y0 = self.ball_pos
+        vx, vy = self.ball_vel
+        g = self.ball_acc[1]
+        r = self.ball_radius
+        best = None
+
+        #  ╭──────────────────────────────────────────────────────────────────╮
+        #  │ Walls and ceiling; each gap function is positive inside the wall │
+        #  ╰──────────────────────────────────────────────────────────────────╯
+        walls = (
+            ('left', 0.0, -vx, r - x0),
+            ('right', 0.0, vx, x0 + r - self.width),
+            ('top', -0.5 * g, -vy, r - y0),
+        )
+        for kind, a, b, c in walls:
+            t = self.impact_time(a, b, c)
+            if t is not None and t <= horizon:
+                horizon = t
+                best = (t, kind, None)
+
+        #  ╭─────────────────────────────────────────────────────────────╮
+        #  │                                                             │
+        #  │ Terrain: walk the segments in the direction of travel, only │
+        #  │ as far as the ball can get before the current best impact   │
+        #  │                                                             │
+        #  ╰─────────────────────────────────────────────────────────────╯
+        index = self.terrain_index
+        i = index.segment_at(x0)
+        if i < 0:
+            return best
+        first = i
+        while 0 <= i <= index.last:
+            x1 = index.xs[i]
+            x2 = index.xs[i+1]
+            #  ╭────────────────────────────────────────────────────────╮
+            #  │ Time window during which the ball is over this segment │
+            #  ╰────────────────────────────────────────────────────────╯
+            if vx > 0:
+                t_lo, t_hi = (x1 - x0) / vx, (x2 - x0) / vx
+            elif vx < 0:
+                t_lo, t_hi = (x2 - x0) / vx, (x1 - x0) / vx
+            else:
+                t_lo, t_hi = 0.0, horizon
+            if t_lo > horizon:
+                break
+            m = index.slopes[i]
+            a = 0.5 * g
+            b = vy - m * vx
+            c = y0 + r - (m * x0 + index.intercepts[i])
+            if i == first:
+                t = self.impact_time(a, b, c)
+            else:
+                t = entry_time(a, b, c)
+            if t is not None and max(t_lo, 0.0) <= t <= min(t_hi, horizon):
+                return (t, 'terrain', i)
+            if vx == 0:
+                break
+            i += 1 if vx > 0 else -1
+        return best
+
+    def impact_time(self, a, b, c):
+        #  ╭────────────────────────────────────────────────────────────────╮
+        #  │                                                                │
+        #  │ Like entry_time, but a ball that already overlaps the obstacle │
+        #  │ and is not moving out of it collides right now, as it would in │
+        #  │ the step engine.                                               │
+        #  │                                                                │
+        #  ╰────────────────────────────────────────────────────────────────╯
+        if c > 0 and b >= 0:
+            return 0.0
+        t = entry_time(a, b, c)
+        if t is None or t < 0:
+            return None
+        return t
+
+    def drift(self, t):
+        #  ╭─────────────────────────────────────────────────────────────╮
+        #  │ Move the ball along its free-flight parabola for t seconds. │
+        #  ╰─────────────────────────────────────────────────────────────╯
+        g = self.ball_acc[1]
+        self.ball_pos[0] += self.ball_vel[0] * t
+        self.ball_pos[1] += (self.ball_vel[1] + 0.5 * g * t) * t
+        self.ball_vel[1] += g * t
+        self.time += t
+
+    def resolve_event(self, kind, segment):
+        #  ╭─────────────────────────────────────────────────────╮
+        #  │                                                     │
+        #  │ Apply the bounce for an impact found by next_event. │
+        #  │ Returns True if the ball hit the top wall.          │
+        #  │                                                     │
+        #  ╰─────────────────────────────────────────────────────╯
+        if kind == 'terrain':
+            self.collision_terrain = self.terrain_index
+            self.collision_segment = segment
+            self.resolve_collision()
+            return False
+        #  ╭───────────────────────────────────────────────────────────────╮
+        #  │                                                               │
+        #  │ Snap the ball exactly onto the wall and let the step engine's │
+        #  │ wall handling reflect it (and count ceiling hits)             │
+        #  │                                                               │
+        #  ╰───────────────────────────────────────────────────────────────╯
+        if kind == 'left':
+            self.ball_pos[0] = self.ball_radius
+        elif kind == 'right':
+            self.ball_pos[0] = self.width - self.ball_radius
+        else:
+            self.ball_pos[1] = self.ball_radius
+        return self.check_wall_collision()
+
+    def at_rest(self):
+        #  ╭───────────────────────────────────────────────────────────────╮
+        #  │                                                               │
+        #  │ Return True if the ball has settled on a flat terrain segment │
+        #  │ with no horizontal speed (it can never move again), snapping  │
+        #  │ it onto the surface.                                          │
+        #  │                                                               │
+        #  ╰───────────────────────────────────────────────────────────────╯
+        vx, vy = self.ball_vel
+        if vx != 0 or abs(vy) > self.ball_acc[1] * self.time_step:
+            return False
+        x, y = self.ball_pos
+        index = self.terrain_index
+        i = index.segment_at(x)
+        if i < 0 or index.slopes[i] != 0:
+            return False
+        surface = index.intercepts[i] - self.ball_radius
+        if y < surface - 1e-6:
+            return False
+        self.ball_pos[1] = surface
+        self.ball_vel[1] = 0.0
+        return True
+
+    def step(self):
+        #  ╭───────────────────────────────────────────────────────────────╮
+        #  │                                                               │
+        #  │ Advance by one time step, handling any impacts on the way, so │
+        #  │ the engine can stand in for BallEngine in a frame loop.       │
+        #  │ Returns True if the ball hit the top wall.                    │
+        #  │                                                               │
+        #  ╰───────────────────────────────────────────────────────────────╯
+        return self.advance(self.time_step)
+
+    def advance(self, seconds):
+        #  ╭───────────────────────────────────────────────────────────────╮
+        #  │                                                               │
+        #  │ Advance the simulation by `seconds`, handling every impact on │
+        #  │ the way. Returns True if the ball hit the top wall.           │
+        #  │                                                               │
+        #  ╰───────────────────────────────────────────────────────────────╯
+        end = self.time + seconds
+        hit = False
+        while True:
+            remaining = end - self.time
+            if remaining <= 0:
+                break
+            #  ╭──────────────────────────────────────────────────────────────╮
+            #  │                                                              │
+            #  │ In contact, take plain fixed steps until the ball settles or │
+            #  │ ten steps in a row touch nothing; only then solve for the    │
+            #  │ next impact again                                            │
+            #  │                                                              │
+            #  ╰──────────────────────────────────────────────────────────────╯
+            if self.in_contact():
+                if self.contact_steps(end):
+                    hit = True
+                continue
+            #  ╭───────────────────────────────────────────────────────╮
+            #  │ A ball at rest on a flat segment stays there for good │
+            #  ╰───────────────────────────────────────────────────────╯
+            if self.at_rest():
+                if self.recorder:
+                    self.recorder.record(self, 'rest')
+                self.time = end
+                break
+            event = self.next_event(remaining)
+            if event is None:
+                self.leave_contact()
+                self.drift(remaining)
+                self.time = end
+                break
+            t, kind, segment = event
+            #  ╭──────────────────────────────────────────────────────────────╮
+            #  │                                                              │
+            #  │ A ball sliding on the terrain or wedged in a corner produces │
+            #  │ an endless run of ever shorter bounces; while impacts keep   │
+            #  │ coming faster than the step rate, take fixed steps instead   │
+            #  │                                                              │
+            #  ╰──────────────────────────────────────────────────────────────╯
+            if t < self.min_event_dt:
+                self.short_events += 1
+            else:
+                self.short_events = 0
+            self.drift(t)
+            if self.resolve_event(kind, segment):
+                hit = True
+            self.events += 1
+            if self.recorder:
+                self.recorder.record(self, kind)
+        return hit
+
+    def contact_steps(self, end):
+        #  ╭─────────────────────────────────────────────────────────────────╮
+        #  │                                                                 │
+        #  │ Take fixed steps with the step engine's wall and terrain checks │
+        #  │ until time `end`, the ball comes to rest or leaves contact.     │
+        #  │ Like LeanEngine.advance, the state stays in local variables     │
+        #  │ between steps. Returns True if the ball hit the top wall.       │
+        #  │                                                                 │
+        #  ╰─────────────────────────────────────────────────────────────────╯
+        pos, vel = self.ball_pos, self.ball_vel
+        x, y = pos
+        vx, vy = vel
+        time = self.time
+        dt = self.time_step
+        g = self.ball_acc[1]
+        r = self.ball_radius
+        width = self.width
+        config = self.config
+        damping = config.wall_damping
+        restitution_x = config.restitution_x
+        restitution_y = config.restitution_y
+        index = self.terrain_index
+        xs, ys = index.xs, index.ys
+        slopes, intercepts = index.slopes, index.intercepts
+        normals_x, normals_y = index.nx, index.ny
+        first, last = xs[0], xs[-1]
+        recorder = self.recorder
+        counter = self.counter
+        quiet = self.quiet_steps
+        hit = False
+
+        while time < end:
+            #  ╭──────────────────────────────────────────────────────────╮
+            #  │ Only a ball with no horizontal speed can settle for good │
+            #  ╰──────────────────────────────────────────────────────────╯
+            if vx == 0:
+                pos[0], pos[1], vel[0], vel[1] = x, y, vx, vy
+                self.time, self.counter = time, counter
+                if self.at_rest():
+                    if recorder:
+                        recorder.record(self, 'rest')
+                    self.time = end
+                    return hit
+            step = end - time
+            if step > dt:
+                step = dt
+            #  ╭────────────────────────────────────────╮
+            #  │ Free flight over the step, as in drift │
+            #  ╰────────────────────────────────────────╯
+            moving = vx
+            x += vx * step
+            y += (vy + 0.5 * g * step) * step
+            vy += g * step
+            time += step
+            #  ╭───────────────────────────────────────────────╮
+            #  │ Walls and ceiling, as in check_wall_collision │
+            #  ╰───────────────────────────────────────────────╯
+            if x - r <= 0:
+                x = r
+                vx = -vx * damping
+            elif x + r >= width:
+                x = width - r
+                vx = -vx * damping
+            top = False
+            if y - r <= 0:
+                y = r
+                vy = -vy * damping
+                counter += 1
+                top = hit = True
+            touched = top or vx != moving
+            #  ╭──────────────────────────────────────────────────────╮
+            #  │ Terrain, as in check_collision and resolve_collision │
+            #  ╰──────────────────────────────────────────────────────╯
+            if first <= x <= last:
+                i = bisect_left(xs, x) - 1
+                if i < 0:
+                    i = 0
+                slope = slopes[i]
+                if y + r >= slope * x + intercepts[i]:
+                    nx = normals_x[i]
+                    ny = normals_y[i]
+                    v_dot_n = vx * nx + vy * ny
+                    vx -= 2 * v_dot_n * nx
+                    vy -= 2 * v_dot_n * ny
+                    vx *= restitution_x
+                    vy *= restitution_y
+                    overlap = (y + r) - (slope * (x - xs[i]) + ys[i])
+                    if overlap > 0:
+                        y -= overlap
+                    touched = True
+            #  ╭────────────────────────────────────────────────╮
+            #  │ Hand the recorder only the steps it could keep │
+            #  ╰────────────────────────────────────────────────╯
+            if recorder and (top or time >= recorder.next_sample):
+                pos[0], pos[1], vel[0], vel[1] = x, y, vx, vy
+                self.time, self.counter = time, counter
+                recorder.contact(self, top)
+            quiet = 0 if touched else quiet + 1
+            if quiet >= 10:
+                break
+
+        pos[0], pos[1], vel[0], vel[1] = x, y, vx, vy
+        self.time, self.counter = time, counter
+        self.quiet_steps = quiet
+        if quiet >= 10:
+            self.leave_contact()
+        return hit
+
+    def in_contact(self):
+        #  ╭────────────────────────────────────────────────────────╮
+        #  │ True while impacts come too fast to handle one by one. │
+        #  ╰────────────────────────────────────────────────────────╯
+        return self.short_events > 20
+
+    def leave_contact(self):
+        #  ╭────────────────────────────────────────────────────────────╮
+        #  │                                                            │
+        #  │ Back to free flight: tell the recorder the exact state the │
+        #  │ parabola starts from.                                      │
+        #  │                                                            │
+        #  ╰────────────────────────────────────────────────────────────╯
+        if self.recorder and self.in_contact():
+            self.recorder.record(self, 'flight')
+        self.short_events = 0
+        self.quiet_steps = 0
+
+    def run(self, seconds):
+        #  ╭─────────────────────────────────────────────────╮
+        #  │                                                 │
+        #  │ Simulate the given number of seconds in one go. │
+        #  │ Returns the hit counter.                        │
+        #  │                                                 │
+        #  ╰─────────────────────────────────────────────────╯
+        self.advance(seconds)
+        return self.counter
+
+class EndlessEngine(BallEngine):
+    #  ╭────────────────────────────────────────────────────────────────────╮
+    #  │                                                                    │
+    #  │ Side-scrolling variant of BallEngine: there are no side walls and  │
+    #  │ the ball travels over an endless ChunkedTerrain. The ceiling still │
+    #  │ counts hits.                                                       │
+    #  │                                                                    │
+    #  ╰────────────────────────────────────────────────────────────────────╯
+    def __init__(self, width=800, height=300, seed=None, config=DEFAULTS,
+                 cache_size=8):
+        self.cache_size = cache_size
+        super().__init__(width, height, seed, config)
+
+    def create_terrain(self):
+        #  ╭─────────────────────────────────────────────────────────────╮
+        #  │ Start a new endless terrain from the simulation's generator │
+        #  ╰─────────────────────────────────────────────────────────────╯
+        self.terrain = ChunkedTerrain(self.rng.getrandbits(64), self.height,
+                                      self.width, self.cache_size, self.config)
+        #  ╭────────────────────────────────────────────────────╮
+        #  │ There is no single terrain polygon in endless mode │
+        #  ╰────────────────────────────────────────────────────╯
+        self.terrain_points = []
+
+    def check_wall_collision(self):
+        #  ╭───────────────────────────────────────────────────╮
+        #  │                                                   │
+        #  │ Only the top wall exists: bounce and count a hit. │
+        #  │ Returns True if the top wall was hit.             │
+        #  │                                                   │
+        #  ╰───────────────────────────────────────────────────╯
+        if self.ball_pos[1] - self.ball_radius <= 0:
+            self.ball_pos[1] = self.ball_radius
+            self.ball_vel[1] = -self.ball_vel[1] * self.config.wall_damping
+            self.increment_counter()
+            return True
+        return False
+
+    def check_collision(self):
+        #  ╭─────────────────────────────────────────────────────────────╮
+        #  │                                                             │
+        #  │ Check if the ball collides with the terrain chunk under it. │
+        #  │ Returns True if collision occurs.                           │
+        #  │                                                             │
+        #  ╰─────────────────────────────────────────────────────────────╯
+        x, y = self.ball_pos
+        index = self.terrain.chunk_at(x)
+        i = index.segment_at(x)
+        if y + self.ball_radius >= index.slopes[i] * x + index.intercepts[i]:
+            self.collision_terrain = index
+            self.collision_segment = i
+            return True
+        return False
+
+    def results(self):
+        #  ╭───────────────────────────────────────────────────────────╮
+        #  │ Score so far, plus the distance travelled from the start. │
+        #  ╰───────────────────────────────────────────────────────────╯
+        score = super().results()
+        score['distance'] = self.ball_pos[0] - self.width / 2
+        return score
+
+class MultiBallEngine(BallEngine):
+    #  ╭────────────────────────────────────────────────────────────────────╮
+    #  │                                                                    │
+    #  │ Many balls sharing one playfield. Each ball goes through the       │
+    #  │ usual wall and terrain handling, then overlapping balls bounce off │
+    #  │ each other elastically. Pairs are found through a uniform grid     │
+    #  │ rebuilt every step, so each ball is only tested against the few    │
+    #  │ balls in its own and the neighbouring cells. ball_pos and ball_vel │
+    #  │ track ball 0 between steps (for the trail).                        │
+    #  │                                                                    │
+    #  ╰────────────────────────────────────────────────────────────────────╯
+    def __init__(self, width=800, height=300, seed=None, config=DEFAULTS,
+                 n_balls=200):
+        self.n_balls = n_balls
+        super().__init__(width, height, seed, config)
+        #  ╭───────────────────────────────────────────────────────────────────╮
+        #  │                                                                   │
+        #  │ Coarser steps than the single-ball game: hundreds of balls        │
+        #  │ still fit in a frame, and balls move well under a radius per step │
+        #  │                                                                   │
+        #  ╰───────────────────────────────────────────────────────────────────╯
+        self.time_step = 0.004
+        #  ╭─────────────────────────────────────────────────────────────────╮
+        #  │                                                                 │
+        #  │ Grid cells one ball diameter wide: touching balls are always in │
+        #  │ the same or adjacent cells                                      │
+        #  │                                                                 │
+        #  ╰─────────────────────────────────────────────────────────────────╯
+        self.cell_size = 2 * self.ball_radius
+
+    def reset(self):
+        #  ╭──────────────────────────────────────────────────────────────────╮
+        #  │                                                                  │
+        #  │ Scatter the balls over the upper third of the playfield and zero │
+        #  │ the hit counter (no ball starts against the ceiling).            │
+        #  │                                                                  │
+        #  ╰──────────────────────────────────────────────────────────────────╯
+        self.counter = 0
+        self.steps = 0
+        r = self.ball_radius
+        self.positions = [[self.rng.uniform(r, self.width - r),
+                           self.rng.uniform(r, self.height / 3)]
+                          for _ in range(self.n_balls)]
+        self.velocities = [[self.rng.uniform(-50, 50), 0.0]
+                           for _ in range(self.n_balls)]
+        self.ball_pos = self.positions[0]
+        self.ball_vel = self.velocities[0]
+        self.ball_acc = [0.0, self.config.gravity]
+        #  ╭──────────────────────────────────────────────────────────╮
+        #  │ Balls that hit the ceiling since the display last looked │
+        #  ╰──────────────────────────────────────────────────────────╯
+        self.hit_balls = set()
+
+    def step(self):
+        #  ╭─────────────────────────────────────────────────────────────╮
+        #  │                                                             │
+        #  │ Advance every ball by one time step, then resolve ball-ball │
+        #  │ collisions. Returns True if any ball hit the top wall.      │
+        #  │                                                             │
+        #  ╰─────────────────────────────────────────────────────────────╯
+        dt = self.time_step
+        dv = self.ball_acc[1] * dt
+        hit = False
+        for i, pos in enumerate(self.positions):
+            vel = self.velocities[i]
+            vel[1] += dv
+            pos[0] += vel[0] * dt
+            pos[1] += vel[1] * dt
+            #  ╭───────────────────────────────────────────────────╮
+            #  │ Point the single-ball collision code at this ball │
+            #  ╰───────────────────────────────────────────────────╯
+            self.ball_pos = pos
+            self.ball_vel = vel
+            if self.check_wall_collision():
+                self.hit_balls.add(i)
+                hit = True
+            if self.check_collision():
+                self.resolve_collision()
+        self.collide_balls()
+
+        self.ball_pos = self.positions[0]
+        self.ball_vel = self.velocities[0]
+        self.steps += 1
+        return hit
+
+    def collide_balls(self):
+        #  ╭──────────────────────────────────────────────────────────────────╮
+        #  │                                                                  │
+        #  │ Bin the balls into grid cells and resolve every overlapping pair │
+        #  │ within a cell or between a cell and its forward neighbours (each │
+        #  │ pair of cells is visited once).                                  │
+        #  │                                                                  │
+        #  ╰──────────────────────────────────────────────────────────────────╯
+        size = self.cell_size
+        grid = {}
+        for i, (x, y) in enumerate(self.positions):
+            key = (int(x // size), int(y // size))
+            cell = grid.get(key)
+            if cell is None:
+                grid[key] = [i]
+            else:
+                cell.append(i)
+
+        for (cx, cy), cell in grid.items():
+            for a, i in enumerate(cell):
+                for j in cell[a + 1:]:
+                    self.bounce(i, j)
+            for dx, dy in ((1, 0), (-1, 1), (0, 1), (1, 1)):
+                other = grid.get((cx + dx, cy + dy))
+                if other:
+                    for i in cell:
+                        for j in other:
+                            self.bounce(i, j)
+
+    def bounce(self, i, j):
+        #  ╭───────────────────────────────────────────────────────────────╮
+        #  │                                                               │
+        #  │ Elastic collision of two equal balls: if they overlap and are │
+        #  │ approaching, swap their velocity components along the line    │
+        #  │ between the centres, then push them apart so they just touch. │
+        #  │                                                               │
+        #  ╰───────────────────────────────────────────────────────────────╯
+        p, q = self.positions[i], self.positions[j]
+        dx = q[0] - p[0]
+        dy = q[1] - p[1]
+        dist2 = dx * dx + dy * dy
+        diameter = 2 * self.ball_radius
+        if dist2 >= diameter * diameter or dist2 == 0:
+            return
+        dist = math.sqrt(dist2)
+        nx = dx / dist
+        ny = dy / dist
+        #  ╭────────────────────────────────╮
+        #  │ Closing speed along the normal │
+        #  ╰────────────────────────────────╯
+        v, w = self.velocities[i], self.velocities[j]
+        closing = (v[0] - w[0]) * nx + (v[1] - w[1]) * ny
+        if closing > 0:
+            v[0] -= closing * nx
+            v[1] -= closing * ny
+            w[0] += closing * nx
+            w[1] += closing * ny
+        #  ╭─────────────────────────────────────────╮
+        #  │ Split the overlap between the two balls │
+        #  ╰─────────────────────────────────────────╯
+        push = (diameter - dist) / 2
+        p[0] -= push * nx
+        p[1] -= push * ny
+        q[0] += push * nx
+        q[1] += push * ny
+
+    def results(self):
+        #  ╭─────────────────────────────────────────────────────────────╮
+        #  │ Score so far (hits by all balls), plus the number of balls. │
+        #  ╰─────────────────────────────────────────────────────────────╯
+        score = super().results()
+        score['balls'] = self.n_balls
+        return score
+
+class LeanEngine(BallEngine):
+    #  ╭─────────────────────────────────────────────────────────────────────╮
+    #  │                                                                     │
+    #  │ BallEngine with the ball state held in four float attributes (x,    │
+    #  │ y, vx, vy) instead of lists, and the whole step (gravity, walls,    │
+    #  │ terrain bounce) inlined, so stepping creates no lists, tuples or    │
+    #  │ bound methods. advance() keeps the state in local variables for     │
+    #  │ the whole loop; step() is advance(1), for frame loops. Bounces      │
+    #  │ use the terrain's precomputed normals. Results match BallEngine     │
+    #  │ step for step. The fastest pure-Python engine; no NumPy needed.     │
+    #  │                                                                     │
+    #  │ ball_pos and ball_vel are copies: assigning them sets the state,    │
+    #  │ but changing them in place has no effect, so the per-ball collision │
+    #  │ methods of BallEngine raise TypeError on this engine.               │
+    #  │                                                                     │
+    #  ╰─────────────────────────────────────────────────────────────────────╯
+    @property
+    def ball_pos(self):
+        return [self.x, self.y]
+
+    @ball_pos.setter
+    def ball_pos(self, pos):
+        self.x, self.y = pos
+
+    @property
+    def ball_vel(self):
+        return [self.vx, self.vy]
+
+    @ball_vel.setter
+    def ball_vel(self, vel):
+        self.vx, self.vy = vel
+
+    def step(self):
+        #  ╭─────────────────────────────────────────────────────────────╮
+        #  │                                                             │
+        #  │ Advance the simulation by one time step.                    │
+        #  │ Returns True if the ball hit the top wall during this step. │
+        #  │                                                             │
+        #  ╰─────────────────────────────────────────────────────────────╯
+        return self.advance(1)
+
+    #  ╭───────────────────────────────────────────────────────────────────╮
+    #  │                                                                   │
+    #  │ The per-ball collision methods of BallEngine would work on copies │
+    #  │ of the state, so they are not available here                      │
+    #  │                                                                   │
+    #  ╰───────────────────────────────────────────────────────────────────╯
+    def check_wall_collision(self):
+        raise TypeError('LeanEngine steps only through step() and advance()')
+
+    check_collision = resolve_collision = check_wall_collision
+
+    def run(self, seconds):
+        #  ╭────────────────────────────────────────────────────────╮
+        #  │                                                        │
+        #  │ Step the simulation for the given number of simulated  │
+        #  │ seconds, as fast as possible. Returns the hit counter. │
+        #  │                                                        │
+        #  ╰────────────────────────────────────────────────────────╯
+        self.advance(int(round(seconds / self.time_step)))
+        return self.counter
+
+    def advance(self, steps):
+        #  ╭──────────────────────────────────────────────────────────────────╮
+        #  │                                                                  │
+        #  │ Take `steps` physics steps, with the same arithmetic in the same │
+        #  │ order as BallEngine.step. Returns True if the top wall was hit.  │
+        #  │                                                                  │
+        #  ╰──────────────────────────────────────────────────────────────────╯
+        x, y, vx, vy = self.x, self.y, self.vx, self.vy
+        dt = self.time_step
+        dv = self.ball_acc[1] * dt
+        r = self.ball_radius
+        width = self.width
+        config = self.config
+        damping = config.wall_damping
+        restitution_x = config.restitution_x
+        restitution_y = config.restitution_y
+        index = self.terrain_index
+        xs, ys = index.xs, index.ys
+        slopes, intercepts = index.slopes, index.intercepts
+        normals_x, normals_y = index.nx, index.ny
+        first, last = xs[0], xs[-1]
+        #  ╭───────────────────────────────────────────────────────────────╮
+        #  │                                                               │
+        #  │ A ball this far up is above every terrain point (the pixel of │
+        #  │ slack covers rounding in the height formula)                  │
+        #  │                                                               │
+        #  ╰───────────────────────────────────────────────────────────────╯
+        clear = index.top - r - 1
+        counter = self.counter
+        hit = False
+
+        for _ in range(steps):
+            #  ╭───────────────────────────────────────────────╮
+            #  │ Update velocity and position based on physics │
+            #  ╰───────────────────────────────────────────────╯
+            vy += dv
+            x += vx * dt
+            y += vy * dt
+            #  ╭──────────────────────╮
+            #  │ Left and right walls │
+            #  ╰──────────────────────╯
+            if x - r <= 0:
+                x = r
+                vx = -vx * damping
+            elif x + r >= width:
+                x = width - r
+                vx = -vx * damping
+            #  ╭────────────────────────╮
+            #  │ Top wall: count as hit │
+            #  ╰────────────────────────╯
+            if y - r <= 0:
+                y = r
+                vy = -vy * damping
+                counter += 1
+                hit = True
+            #  ╭───────────────────────────────────────────────────────╮
+            #  │ Terrain: find the segment under x, then bounce off it │
+            #  ╰───────────────────────────────────────────────────────╯
+            if y < clear or x < first or x > last:
+                continue
+            i = bisect_left(xs, x) - 1
+            if i < 0:
+                i = 0
+            slope = slopes[i]
+            if y + r >= slope * x + intercepts[i]:
+                nx = normals_x[i]
+                ny = normals_y[i]
+                v_dot_n = vx * nx + vy * ny
+                vx -= 2 * v_dot_n * nx
+                vy -= 2 * v_dot_n * ny
+                vx *= restitution_x
+                vy *= restitution_y
+                overlap = (y + r) - (slope * (x - xs[i]) + ys[i])
+                if overlap > 0:
+                    y -= overlap
+
+        self.x, self.y, self.vx, self.vy = x, y, vx, vy
+        self.counter = counter
+        self.steps += steps
+        return hit
+
+#  ╭──────────────────────────────────────────────────╮
+#  │ Physics engines selectable from the command line │
+#  ╰──────────────────────────────────────────────────╯
+ENGINES = {'step': BallEngine, 'lean': LeanEngine, 'event': EventEngine,
+           'endless': EndlessEngine}
+
+def run_headless(duration=120, engine='step', seed=None, config=DEFAULTS):
+    #  ╭─────────────────────────────────────────────────────────╮
+    #  │                                                         │
+    #  │ Play a full game without a display and return its score │
+    #  │ (hits, simulated time and HPM).                         │
+    #  │                                                         │
+    #  ╰─────────────────────────────────────────────────────────╯
+    engine = ENGINES[engine](seed=seed, config=config)
+    engine.run(duration)
+    return engine.results()
@@ -0,0 +1,603 @@
+# -*- coding: utf-8 -*-
+#  ╭──────────────────────────────────────────────────────────────────╮
+#  │                                                                  │
+#  │ The Tk game window: the single-ball game, endless side-scrolling │
+#  │ mode and multi-ball mode.                                        │
+#  │                                                                  │
+#  ╰──────────────────────────────────────────────────────────────────╯
+
+import tkinter as tk
+import random
+import math
+import time
+
+from .config import DEFAULTS
+from .engine import ENGINES, MultiBallEngine
+from .trail import TrailBuffer
+from .profiler import FrameProfiler
+
+class BallSimulation:
+    #  ╭─────────────────────────────────────────────────────────╮
+    #  │ Off-screen coordinates used to park unused canvas items │
+    #  ╰─────────────────────────────────────────────────────────╯
+    HIDDEN = (-10, -10, -10, -10)
+    #  ╭───────────────────────────────────────╮
+    #  │ Length of a game in simulated seconds │
+    #  ╰───────────────────────────────────────╯
+    GAME_LENGTH = 120
+
+    def __init__(self, master, fps=60, engine='step', seed=None,
+                 trail_capacity=1024, profile=None, render='items',
+                 start=True, config=DEFAULTS):
+        self.master = master
+        #  ╭──────────────────────────╮
+        #  │ Define canvas dimensions │
+        #  ╰──────────────────────────╯
+        self.width = 800
+        self.height = 300
+        #  ╭──────────────────────────────────╮
+        #  │ Create canvas widget for drawing │
+        #  ╰──────────────────────────────────╯
+        self.canvas = tk.Canvas(master, width=self.width, height=self.height)
+        self.canvas.pack()
+        #  ╭───────────────────────────────────────────────────╮
+        #  │ World x-coordinate of the left edge of the canvas │
+        #  ╰───────────────────────────────────────────────────╯
+        self.camera_x = 0.0
+
+        #  ╭────────────────────────────────────────────────────────────────╮
+        #  │ Create the physics engine (terrain, ball state and step logic) │
+        #  ╰────────────────────────────────────────────────────────────────╯
+        self.config = config
+        self.engine = self.create_engine(engine, seed)
+        #  ╭──────────────────────────────────────────────────────────╮
+        #  │ Separate generator for cosmetic randomness (ball colors) │
+        #  ╰──────────────────────────────────────────────────────────╯
+        self.rng = random.Random(seed)
+
+        #  ╭─────────────────────────────────────────────────────────────╮
+        #  │ Flag to control simulation updates (active until game over) │
+        #  ╰─────────────────────────────────────────────────────────────╯
+        self.simulation_active = True
+
+        #  ╭─────────────────────────────────────────────╮
+        #  │ Create text item on canvas to display stats │
+        #  ╰─────────────────────────────────────────────╯
+        self.counter_text = self.canvas.create_text(
+            10, 10, anchor='nw',
+            text=f"Hits: {self.engine.counter}", font=('Arial', 14)
+        )
+
+        #  ╭───────────────────────────────────────────────────────╮
+        #  │ Bind ESC key and middle mouse button to quit the game │
+        #  ╰───────────────────────────────────────────────────────╯
+        self.master.bind('<Escape>', self.close_program)
+        self.master.bind('<Button-2>', self.close_program)
+
+        #  ╭──────────────────────────────────────────────────────────────╮
+        #  │                                                              │
+        #  │ With render='image' everything but the text is drawn by a    │
+        #  │ PixelRenderer, which then also stands in for the canvas when │
+        #  │ creating, moving and recoloring balls                        │
+        #  │                                                              │
+        #  ╰──────────────────────────────────────────────────────────────╯
+        self.renderer = None
+        if render == 'image':
+            from .render import PixelRenderer
+            self.renderer = PixelRenderer(self.canvas, self.width, self.height,
+                                          self.engine.ball_radius)
+        self.sprites = self.renderer or self.canvas
+
+        #  ╭──────────────────────────────────────────────╮
+        #  │ Draw the terrain at the bottom of the canvas │
+        #  ╰──────────────────────────────────────────────╯
+        self.draw_terrain()
+
+        #  ╭────────────────────────────────────────╮
+        #  │ Create the ball (5 pixels in diameter) │
+        #  ╰────────────────────────────────────────╯
+        self.ball_radius = self.engine.ball_radius
+        #  ╭────────────────────────────────────╮
+        #  │ 4 pixel radius = 8 pixels diameter │
+        #  ╰────────────────────────────────────╯
+        self.ball = self.create_ball()
+
+        #  ╭─────────────────────────────────────────────────────────────────╮
+        #  │                                                                 │
+        #  │ Fixed-timestep loop: physics runs in engine.time_step sub-steps │
+        #  │ accumulated against a monotonic clock, rendering at `fps`       │
+        #  │                                                                 │
+        #  ╰─────────────────────────────────────────────────────────────────╯
+        self.frame_interval = 1.0 / fps
+        #  ╭────────────────────────────────────────────────────────────────╮
+        #  │                                                                │
+        #  │ Longest frame the loop will catch up on (avoids a death spiral │
+        #  │ after the window was dragged or the host stalled)              │
+        #  │                                                                │
+        #  ╰────────────────────────────────────────────────────────────────╯
+        self.max_frame_time = 0.25
+        self.game_length = self.GAME_LENGTH
+        self.accumulator = 0.0
+        #  ╭──────────────────────────────────────────────────────────────╮
+        #  │ Previous physics state, for interpolating the drawn position │
+        #  ╰──────────────────────────────────────────────────────────────╯
+        self.prev_x, self.prev_y = self.engine.ball_pos
+
+        #  ╭────────────────────────────────────────────────╮
+        #  │ Remember last dot position to space trail dots │
+        #  ╰────────────────────────────────────────────────╯
+        self.last_dot_x, self.last_dot_y = self.engine.ball_pos
+        #  ╭──────────────────────────────────────────────────────────────╮
+        #  │                                                              │
+        #  │ Pre-create the trail dot items off-screen; the ring buffer   │
+        #  │ recycles them instead of creating and deleting canvas items. │
+        #  │ The pixel renderer keeps its own trail, with no item limit.  │
+        #  │                                                              │
+        #  ╰──────────────────────────────────────────────────────────────╯
+        self.dots = TrailBuffer([] if self.renderer else [
+            self.canvas.create_oval(*self.HIDDEN, fill='black', outline='',
+                                    tags=('world',))
+            for _ in range(trail_capacity)
+        ])
+
+        #  ╭──────────────────────────────────────────────────────────────╮
+        #  │                                                              │
+        #  │ Optional instrumentation: overlay under the stats and a JSON │
+        #  │ report written to `profile` on exit                          │
+        #  │                                                              │
+        #  ╰──────────────────────────────────────────────────────────────╯
+        self.profile_path = profile
+        self.profiler = None
+        if profile:
+            self.profiler = FrameProfiler(1 / self.engine.time_step)
+            self.profile_text = self.canvas.create_text(
+                10, 32, anchor='nw', text='', font=('Arial', 9)
+            )
+
+        #  ╭──────────────────────────────────────╮
+        #  │ Record start time of the frame clock │
+        #  ╰──────────────────────────────────────╯
+        self.last_time = time.perf_counter()
+        self.next_frame = self.last_time
+        #  ╭─────────────────────────────────────────────────────────╮
+        #  │ Top wall hit and physics steps not yet shown by a frame │
+        #  ╰─────────────────────────────────────────────────────────╯
+        self.hit = False
+        self.frame_steps = 0
+        #  ╭─────────────────────────────────────────────────────────────╮
+        #  │                                                             │
+        #  │ Start the Tk timer loops, unless another scheduler (such as │
+        #  │ AsyncGameLoop) will drive the game                          │
+        #  │                                                             │
+        #  ╰─────────────────────────────────────────────────────────────╯
+        if start:
+            self.start()
+
+    def start(self):
+        #  ╭─────────────────────────────────────╮
+        #  │ Start updating the on-screen status │
+        #  ╰─────────────────────────────────────╯
+        self.update_status()
+        #  ╭──────────────────────────╮
+        #  │ Start the animation loop │
+        #  ╰──────────────────────────╯
+        self.animate()
+        #  ╭───────────────────────────────────────────────╮
+        #  │ Start cleanup for trail dots older than 5 sec │
+        #  ╰───────────────────────────────────────────────╯
+        self.cleanup_trail()
+
+    def draw_terrain(self):
+        #  ╭─────────────────────────────────────────────────╮
+        #  │ Draw the engine's terrain polygon on the canvas │
+        #  ╰─────────────────────────────────────────────────╯
+        if self.renderer:
+            self.renderer.draw_terrain(self.engine.terrain_index, '#76eec6')
+        else:
+            self.canvas.create_polygon(self.engine.terrain_points,
+                                       fill='#76eec6')
+
+    def animate(self):
+        #  ╭───────────────────────────────────────────────────────────────╮
+        #  │                                                               │
+        #  │ Run the physics sub-steps owed since the last frame, draw the │
+        #  │ ball interpolated between the last two physics states, and    │
+        #  │ schedule the next frame.                                      │
+        #  │                                                               │
+        #  ╰───────────────────────────────────────────────────────────────╯
+        #  ╭───────────────────────────────────────────────────╮
+        #  │ If simulation is no longer active, stop animation │
+        #  ╰───────────────────────────────────────────────────╯
+        if not self.simulation_active:
+            return
+
+        #  ╭───────────────────────────────────────────────╮
+        #  │ Instrumentation: how late this callback fired │
+        #  ╰───────────────────────────────────────────────╯
+        now = time.perf_counter()
+        if self.profiler:
+            self.profiler.late(int((now - self.next_frame) * 1e9))
+        self.advance_physics()
+        self.render()
+
+        #  ╭───────────────────────────────────────────────────────╮
+        #  │ Schedule the next frame against the ideal frame clock │
+        #  ╰───────────────────────────────────────────────────────╯
+        self.next_frame = max(self.next_frame + self.frame_interval, now)
+        delay = int((self.next_frame - time.perf_counter()) * 1000)
+        self.master.after(max(delay, 1), self.animate)
+
+    def advance_physics(self):
+        #  ╭──────────────────────────────────────────────────────────────────╮
+        #  │                                                                  │
+        #  │ Run the fixed physics steps owed for the real time elapsed since │
+        #  │ the last call, leaving trail dots as the ball moves.             │
+        #  │                                                                  │
+        #  ╰──────────────────────────────────────────────────────────────────╯
+        #  ╭──────────────────────────────────────────────────────╮
+        #  │ Accumulate the real time elapsed since the last call │
+        #  ╰──────────────────────────────────────────────────────╯
+        now = time.perf_counter()
+        self.accumulator += min(now - self.last_time, self.max_frame_time)
+        self.last_time = now
+        prof = self.profiler
+        if prof:
+            lap = time.perf_counter_ns()
+
+        #  ╭─────────────────────────────────────────────────────╮
+        #  │ Consume the accumulated time in fixed physics steps │
+        #  ╰─────────────────────────────────────────────────────╯
+        engine = self.engine
+        dt = engine.time_step
+        end = self.game_end
+        while self.accumulator >= dt and engine.elapsed < end:
+            self.prev_x, self.prev_y = engine.ball_pos
+            if engine.step():
+                self.hit = True
+            if prof:
+                lap = prof.lap('physics', lap)
+            #  ╭───────────────────────────────────╮
+            #  │ Leave a dot trail behind the ball │
+            #  ╰───────────────────────────────────╯
+            self.leave_trail()
+            if prof:
+                lap = prof.lap('trail', lap)
+            self.accumulator -= dt
+            self.frame_steps += 1
+
+    def render(self):
+        #  ╭────────────────────────────────────────────────────────────╮
+        #  │                                                            │
+        #  │ Redraw, interpolated by the fraction of a step left in the │
+        #  │ accumulator, and close the profiler's frame.               │
+        #  │                                                            │
+        #  ╰────────────────────────────────────────────────────────────╯
+        prof = self.profiler
+        if prof:
+            lap = time.perf_counter_ns()
+        self.draw(self.hit, min(self.accumulator / self.engine.time_step, 1.0))
+        if self.renderer:
+            self.renderer.flush(time.perf_counter())
+        self.hit = False
+        if prof:
+            prof.lap('tk', lap)
+            prof.end_frame(self.frame_steps)
+        self.frame_steps = 0
+
+    def create_engine(self, engine, seed):
+        #  ╭───────────────────────────────────────────────────────────────╮
+        #  │ Return the physics engine named `engine` sized to the canvas. │
+        #  ╰───────────────────────────────────────────────────────────────╯
+        return ENGINES[engine](self.width, self.height, seed, self.config)
+
+    def create_ball(self):
+        #  ╭─────────────────────────────────────────────────────────╮
+        #  │ Create the ball's canvas item at its starting position. │
+        #  ╰─────────────────────────────────────────────────────────╯
+        x, y = self.engine.ball_pos
+        return self.sprites.create_oval(
+            x - self.ball_radius, y - self.ball_radius,
+            x + self.ball_radius, y + self.ball_radius,
+            fill=self.get_random_color(),
+            outline=''
+        )
+
+    def draw(self, hit, alpha):
+        #  ╭────────────────────────────────────────────────────────────────────╮
+        #  │                                                                    │
+        #  │ Recolor the ball after a top wall hit and move it to the point     │
+        #  │ `alpha` of the way from the previous physics state to the current. │
+        #  │                                                                    │
+        #  ╰────────────────────────────────────────────────────────────────────╯
+        if hit:
+            self.sprites.itemconfig(self.ball, fill=self.get_random_color())
+        x, y = self.engine.ball_pos
+        x = self.prev_x + (x - self.prev_x) * alpha
+        y = self.prev_y + (y - self.prev_y) * alpha
+        self.update_camera(x)
+        x -= self.camera_x
+        self.sprites.coords(self.ball,
+                           x - self.ball_radius, y - self.ball_radius,
+                           x + self.ball_radius, y + self.ball_radius)
+
+    def update_camera(self, x):
+        #  ╭─────────────────────────────────────────────────────────────────╮
+        #  │                                                                 │
+        #  │ Follow the ball at world x-coordinate x. The playfield fits the │
+        #  │ canvas, so the camera never moves here.                         │
+        #  │                                                                 │
+        #  ╰─────────────────────────────────────────────────────────────────╯
+        pass
+
+    def leave_trail(self):
+        #  ╭─────────────────────────────────────────────────╮
+        #  │                                                 │
+        #  │ Place a small dot on the canvas every 10 pixels │
+        #  │ to leave a visible trail.                       │
+        #  │                                                 │
+        #  ╰─────────────────────────────────────────────────╯
+        current_x, current_y = self.engine.ball_pos
+        #  ╭─────────────────────────────────────────╮
+        #  │ Calculate distance moved since last dot │
+        #  ╰─────────────────────────────────────────╯
+        dx = current_x - self.last_dot_x
+        dy = current_y - self.last_dot_y
+        if dx * dx + dy * dy >= 100:
+            #  ╭─────────────────────────────────────────────────────────────╮
+            #  │                                                             │
+            #  │ Stamp the dot into the pixel buffer, or move a recycled dot │
+            #  │ item into place                                             │
+            #  │                                                             │
+            #  ╰─────────────────────────────────────────────────────────────╯
+            now = time.perf_counter()
+            screen_x = current_x - self.camera_x
+            if self.renderer:
+                self.renderer.add_dot(screen_x, current_y, now)
+            else:
+                dot = self.dots.add(now)
+                if dot is not None:
+                    self.canvas.coords(dot,
+                                       screen_x - 1, current_y - 1,
+                                       screen_x + 1, current_y + 1)
+            self.last_dot_x = current_x
+            self.last_dot_y = current_y
+
+    def close_program(self, event=None):
+        #  ╭───────────────────────────────────────────────────────────────╮
+        #  │ Shut down the program, writing the profile report if enabled. │
+        #  ╰───────────────────────────────────────────────────────────────╯
+        if self.profiler:
+            self.profiler.dump(self.profile_path)
+        self.master.destroy()
+
+    def get_random_color(self):
+        #  ╭───────────────────────────────────╮
+        #  │ Return a random hex color string. │
+        #  ╰───────────────────────────────────╯
+        return f'#{self.rng.randint(0, 255):02x}' + \
+               f'{self.rng.randint(0, 255):02x}' + \
+               f'{self.rng.randint(0, 255):02x}'
+
+    def cleanup_trail(self):
+        #  ╭─────────────────────────────────────╮
+        #  │ Expire old trail dots every 100 ms. │
+        #  ╰─────────────────────────────────────╯
+        self.expire_trail()
+        self.master.after(100, self.cleanup_trail)
+
+    def expire_trail(self):
+        #  ╭─────────────────────────────────────────────────────────────╮
+        #  │                                                             │
+        #  │ Remove dots from the canvas that are older than 5 seconds.  │
+        #  │ This helps keep the canvas from cluttering up. Expired dots │
+        #  │ are popped from the front of the ring buffer and parked     │
+        #  │ off-screen for reuse.                                       │
+        #  │                                                             │
+        #  ╰─────────────────────────────────────────────────────────────╯
+        prof = self.profiler
+        if prof:
+            lap = time.perf_counter_ns()
+        for dot in self.dots.expire(time.perf_counter()):
+            self.canvas.coords(dot, *self.HIDDEN)
+        if prof:
+            prof.lap('trail', lap)
+
+    def update_status(self):
+        #  ╭─────────────────────────────────────────────────────────╮
+        #  │ Refresh the status every 100 ms until the game is over. │
+        #  ╰─────────────────────────────────────────────────────────╯
+        if self.show_status():
+            self.master.after(100, self.update_status)
+
+    @property
+    def game_end(self):
+        #  ╭───────────────────────────────────────────────────────────────────╮
+        #  │                                                                   │
+        #  │ Simulated time at which the game is over: half a step short of    │
+        #  │ the game length, as the summed time steps round either side of it │
+        #  │                                                                   │
+        #  ╰───────────────────────────────────────────────────────────────────╯
+        return self.game_length - self.engine.time_step / 2
+
+    def stats(self):
+        #  ╭──────────────────────────────────────────────────────────────╮
+        #  │                                                              │
+        #  │ Current score as a dict: hits, simulated time (capped at the │
+        #  │ game length), HPM, and whether the game is over.             │
+        #  │                                                              │
+        #  ╰──────────────────────────────────────────────────────────────╯
+        run_time = min(self.engine.elapsed, self.game_length)
+        counter = self.engine.counter
+        hpm = (counter / run_time * 60) if run_time > 0 else 0
+        return {'hits': counter, 'time': run_time, 'hpm': hpm,
+                'game_over': not self.simulation_active}
+
+    def show_status(self):
+        #  ╭───────────────────────────────────────────────────────────╮
+        #  │                                                           │
+        #  │ Update the on-screen status text with current hit count,  │
+        #  │ elapsed run time, and hits per minute (HPM). If 2 minutes │
+        #  │ have passed, stop the simulation and display GAME OVER.   │
+        #  │ Time is the engine's simulated time, so HPM does not      │
+        #  │ depend on the speed of the host.                          │
+        #  │ Returns False once the game is over.                      │
+        #  │                                                           │
+        #  ╰───────────────────────────────────────────────────────────╯
+        run_time = self.engine.elapsed
+        counter = self.engine.counter
+        #  ╭─────────────────────────────────────╮
+        #  │ Refresh the instrumentation overlay │
+        #  ╰─────────────────────────────────────╯
+        prof = self.profiler
+        if prof:
+            lap = time.perf_counter_ns()
+            self.canvas.itemconfig(self.profile_text,
+                                   text=prof.overlay_text())
+            prof.lap('tk', lap)
+        #  ╭───────────────────────────────────────────────╮
+        #  │ Check if 2 minutes (120 seconds) have elapsed │
+        #  ╰───────────────────────────────────────────────╯
+        if run_time >= self.game_end and self.simulation_active:
+            self.simulation_active = False
+            #  ╭─────────────────────╮
+            #  │ Stop the simulation │
+            #  ╰─────────────────────╯
+            run_time = self.game_length
+            #  ╭─────────────────────────────────────╮
+            #  │ Cap the displayed time at 2 minutes │
+            #  ╰─────────────────────────────────────╯
+            hpm = (counter / run_time * 60) if run_time > 0 else 0
+            #  ╭─────────────────────────────────────────────╮
+            #  │ Update the status text to include GAME OVER │
+            #  ╰─────────────────────────────────────────────╯
+            self.canvas.itemconfig(
+                self.counter_text,
+                text=f"Hits: {counter}  Time: {run_time:.1f} s  "
+                     f"HPM: {hpm:.1f}  GAME OVER"
+            )
+            #  ╭─────────────────────────────────────────────────╮
+            #  │ Simulation stops here; user must exit manually. │
+            #  ╰─────────────────────────────────────────────────╯
+            return False
+        else:
+            hpm = (counter / run_time * 60) if run_time > 0 else 0
+            self.canvas.itemconfig(
+                self.counter_text,
+                text=f"Hits: {counter}  Time: {run_time:.1f} s  "
+                     f"HPM: {hpm:.1f}"
+            )
+            return True
+
+class EndlessSimulation(BallSimulation):
+    #  ╭─────────────────────────────────────────────────────────────────────╮
+    #  │                                                                     │
+    #  │ Side-scrolling endurance mode on an EndlessEngine. The camera keeps │
+    #  │ the ball centred; terrain chunks get a polygon item while they are  │
+    #  │ visible and lose it when they scroll off, and every world item      │
+    #  │ (terrain and trail) is shifted with a single canvas move per frame. │
+    #  │ The game runs until the player quits.                               │
+    #  │                                                                     │
+    #  ╰─────────────────────────────────────────────────────────────────────╯
+    GAME_LENGTH = float('inf')
+
+    def __init__(self, master, **options):
+        options['engine'] = 'endless'
+        super().__init__(master, **options)
+
+    def draw_terrain(self):
+        #  ╭───────────────────────────────────────────────────────────╮
+        #  │ Centre the camera on the ball and draw the visible chunks │
+        #  ╰───────────────────────────────────────────────────────────╯
+        self.chunk_items = {}
+        self.camera_x = self.engine.ball_pos[0] - self.width / 2
+        self.show_chunks()
+
+    def update_camera(self, x):
+        #  ╭─────────────────────────────────────────────╮
+        #  │ Scroll the world so the ball stays centred. │
+        #  ╰─────────────────────────────────────────────╯
+        camera_x = x - self.width / 2
+        dx = camera_x - self.camera_x
+        if dx:
+            self.canvas.move('world', -dx, 0)
+            self.camera_x = camera_x
+            self.show_chunks()
+
+    def show_chunks(self):
+        #  ╭───────────────────────────────────────────────────────────────╮
+        #  │                                                               │
+        #  │ Create polygons for chunks scrolling into view and delete the │
+        #  │ ones that have left it.                                       │
+        #  │                                                               │
+        #  ╰───────────────────────────────────────────────────────────────╯
+        terrain = self.engine.terrain
+        first = math.floor(self.camera_x / terrain.chunk_width)
+        last = math.floor((self.camera_x + self.width) / terrain.chunk_width)
+        for k in list(self.chunk_items):
+            if not first <= k <= last:
+                self.canvas.delete(self.chunk_items.pop(k))
+        for k in range(first, last + 1):
+            if k in self.chunk_items:
+                continue
+            index = terrain.chunk(k)
+            points = [(x - self.camera_x, y)
+                      for x, y in zip(index.xs, index.ys)]
+            points.append((points[-1][0], self.height))
+            points.append((points[0][0], self.height))
+            item = self.canvas.create_polygon(points, fill='#76eec6',
+                                              tags=('world',))
+            #  ╭────────────────────────────────────────────────╮
+            #  │ Keep the terrain behind the ball and the trail │
+            #  ╰────────────────────────────────────────────────╯
+            self.canvas.tag_lower(item)
+            self.chunk_items[k] = item
+
+class MultiBallSimulation(BallSimulation):
+    #  ╭────────────────────────────────────────────────────────────────────╮
+    #  │                                                                    │
+    #  │ Game with `balls` colliding balls on a MultiBallEngine. Every ball │
+    #  │ scores on the ceiling and changes color when it does; the trail    │
+    #  │ follows the first ball.                                            │
+    #  │                                                                    │
+    #  ╰────────────────────────────────────────────────────────────────────╯
+    def __init__(self, master, balls=200, **options):
+        self.n_balls = balls
+        super().__init__(master, **options)
+
+    def create_engine(self, engine, seed):
+        #  ╭─────────────────────────────────────────────────────────╮
+        #  │ The multi-ball engine, whatever `engine` was asked for. │
+        #  ╰─────────────────────────────────────────────────────────╯
+        return MultiBallEngine(self.width, self.height, seed, self.config,
+                               self.n_balls)
+
+    def create_ball(self):
+        #  ╭────────────────────────────────────────────────────────────────╮
+        #  │                                                                │
+        #  │ Create one oval per ball (placed by the first draw) and return │
+        #  │ the first ball's, which the trail follows.                     │
+        #  │                                                                │
+        #  ╰────────────────────────────────────────────────────────────────╯
+        self.balls = [
+            self.sprites.create_oval(*self.HIDDEN,
+                                    fill=self.get_random_color(), outline='')
+            for _ in range(self.n_balls)
+        ]
+        return self.balls[0]
+
+    def draw(self, hit, alpha):
+        #  ╭───────────────────────────────────────────────────────────────────╮
+        #  │                                                                   │
+        #  │ Recolor the balls that hit the ceiling and move every ball to its │
+        #  │ current position. At hundreds of balls the steps are short enough │
+        #  │ that interpolating would cost more than it shows.                 │
+        #  │                                                                   │
+        #  ╰───────────────────────────────────────────────────────────────────╯
+        engine = self.engine
+        for i in engine.hit_balls:
+            self.sprites.itemconfig(self.balls[i], fill=self.get_random_color())
+        engine.hit_balls.clear()
+        r = self.ball_radius
+        coords = self.sprites.coords
+        for item, (x, y) in zip(self.balls, engine.positions):
+            coords(item, x - r, y - r, x + r, y + r)
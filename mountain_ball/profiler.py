@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+#  ╭────────────────────────────────────────────╮
+#  │ Opt-in frame profiler for the game window. │
+#  ╰────────────────────────────────────────────╯
+
+import time
+import json
+from collections import deque
+
+class FrameProfiler:
+    #  ╭────────────────────────────────────────────────────────────────────╮
+    #  │                                                                    │
+    #  │ Opt-in instrumentation for the game window. Time spent in each     │
+    #  │ phase of a frame (physics, trail bookkeeping, Tk calls) is         │
+    #  │ measured with perf_counter_ns and accumulated per frame, together  │
+    #  │ with how late each after() callback fired and the achieved physics │
+    #  │ step rate. Keeps the most recent `samples` frames per series.      │
+    #  │                                                                    │
+    #  ╰────────────────────────────────────────────────────────────────────╯
+    phases = ('physics', 'trail', 'tk')
+
+    def __init__(self, nominal_rate, samples=20000):
+        self.nominal_rate = nominal_rate
+        self.series = {name: deque(maxlen=samples)
+                       for name in self.phases + ('lateness',)}
+        #  ╭──────────────────────────────────╮
+        #  │ Totals for the frame in progress │
+        #  ╰──────────────────────────────────╯
+        self.frame = dict.fromkeys(self.phases, 0)
+        self.frames = 0
+        #  ╭──────────────────────────────────────────────────────╮
+        #  │ Step counts for the overall and the recent step rate │
+        #  ╰──────────────────────────────────────────────────────╯
+        self.start_ns = time.perf_counter_ns()
+        self.steps = 0
+        self.window_ns = self.start_ns
+        self.window_steps = 0
+
+    def lap(self, phase, start_ns):
+        #  ╭──────────────────────────────────────────────────────────╮
+        #  │                                                          │
+        #  │ Charge the time since `start_ns` to `phase`; returns the │
+        #  │ current time so laps can be chained.                     │
+        #  │                                                          │
+        #  ╰──────────────────────────────────────────────────────────╯
+        now = time.perf_counter_ns()
+        self.frame[phase] += now - start_ns
+        return now
+
+    def late(self, lateness_ns):
+        #  ╭────────────────────────────────────────────╮
+        #  │ Record how late an after() callback fired. │
+        #  ╰────────────────────────────────────────────╯
+        self.series['lateness'].append(max(lateness_ns, 0))
+
+    def end_frame(self, steps):
+        #  ╭───────────────────────────────────────────────────────────╮
+        #  │ Close the current frame, which ran `steps` physics steps. │
+        #  ╰───────────────────────────────────────────────────────────╯
+        for name in self.phases:
+            self.series[name].append(self.frame[name])
+            self.frame[name] = 0
+        self.frames += 1
+        self.steps += steps
+        self.window_steps += steps
+
+    def step_rate(self):
+        #  ╭───────────────────────────────────────────────────────╮
+        #  │ Physics steps per second since the start of the game. │
+        #  ╰───────────────────────────────────────────────────────╯
+        elapsed = (time.perf_counter_ns() - self.start_ns) / 1e9
+        return self.steps / elapsed if elapsed > 0 else 0.0
+
+    @staticmethod
+    def percentiles(values):
+        #  ╭────────────────────────────────────────────────────────╮
+        #  │ Return p50/p95/p99, mean and max of ns samples, in ms. │
+        #  ╰────────────────────────────────────────────────────────╯
+        if not values:
+            return {}
+        ordered = sorted(values)
+        last = len(ordered) - 1
+        stats = {f'p{p}_ms': ordered[round(last * p / 100)] / 1e6
+                 for p in (50, 95, 99)}
+        stats['mean_ms'] = sum(ordered) / len(ordered) / 1e6
+        stats['max_ms'] = ordered[-1] / 1e6
+        return stats
+
+    @staticmethod
+    def histogram(values):
+        #  ╭──────────────────────────────────────────────────╮
+        #  │ Bucket ns samples by powers of two microseconds. │
+        #  ╰──────────────────────────────────────────────────╯
+        buckets = {}
+        for value in values:
+            bound = 1
+            while bound * 1000 < value:
+                bound *= 2
+            buckets[bound] = buckets.get(bound, 0) + 1
+        return {f'<={bound}us': buckets[bound] for bound in sorted(buckets)}
+
+    def overlay_text(self):
+        #  ╭──────────────────────────────────────────────────────────────╮
+        #  │                                                              │
+        #  │ One-line summary for the on-screen overlay: mean phase times │
+        #  │ over the last frames, the recent step rate and lateness.     │
+        #  │                                                              │
+        #  ╰──────────────────────────────────────────────────────────────╯
+        now = time.perf_counter_ns()
+        elapsed = (now - self.window_ns) / 1e9
+        rate = self.window_steps / elapsed if elapsed > 0 else 0.0
+        self.window_ns = now
+        self.window_steps = 0
+        parts = []
+        for name in self.phases + ('lateness',):
+            recent = list(self.series[name])[-30:]
+            mean = sum(recent) / len(recent) / 1e6 if recent else 0.0
+            parts.append(f'{name} {mean:.2f} ms')
+        parts.append(f'steps {rate:.0f}/{self.nominal_rate:.0f} Hz')
+        return '  '.join(parts)
+
+    def report(self):
+        #  ╭─────────────────────────────────────────────────────╮
+        #  │ Full report: per-series percentiles and histograms. │
+        #  ╰─────────────────────────────────────────────────────╯
+        return {
+            'frames': self.frames,
+            'nominal_step_rate': self.nominal_rate,
+            'achieved_step_rate': self.step_rate(),
+            'series': {
+                name: dict(self.percentiles(values),
+                           samples=len(values),
+                           histogram=self.histogram(values))
+                for name, values in self.series.items()
+            },
+        }
+
+    def dump(self, path):
+        #  ╭──────────────────────────────────╮
+        #  │ Write the report to a JSON file. │
+        #  ╰──────────────────────────────────╯
+        with open(path, 'w') as f:
+            json.dump(self.report(), f, indent=2)
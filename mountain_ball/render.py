@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+#  ╭──────────────────────────────────────────────────╮
+#  │ Single-image render backend for the game window. │
+#  ╰──────────────────────────────────────────────────╯
+
+import tkinter as tk
+import time
+
+try:
+    import numpy as np
+except ImportError:
+    #  ╭───────────────────────────────────────────────────────────────────╮
+    #  │ Without NumPy only the default canvas-item rendering is available │
+    #  ╰───────────────────────────────────────────────────────────────────╯
+    np = None
+
+class PixelRenderer:
+    #  ╭─────────────────────────────────────────────────────────────────────╮
+    #  │                                                                     │
+    #  │ Single-image render backend for the game window. Terrain, trail and │
+    #  │ balls are drawn into one RGB pixel buffer that is handed to a       │
+    #  │ PhotoImage with one put per frame, so the number of Tcl calls no    │
+    #  │ longer grows with the number of dots or balls. Each trail pixel     │
+    #  │ remembers when it was drawn and fades into the background over the  │
+    #  │ trail lifetime. Balls are sprites that answer the same create_oval, │
+    #  │ coords and itemconfig calls as canvas items. Requires NumPy.        │
+    #  │                                                                     │
+    #  ╰─────────────────────────────────────────────────────────────────────╯
+    def __init__(self, canvas, width, height, ball_radius, lifetime=5):
+        if np is None:
+            raise RuntimeError('PixelRenderer requires NumPy')
+        self.canvas = canvas
+        self.width = width
+        self.height = height
+        self.lifetime = lifetime
+        #  ╭───────────────────────────────────────────────────────────╮
+        #  │ Sky and terrain, composed once; trail and balls go on top │
+        #  ╰───────────────────────────────────────────────────────────╯
+        self.background = np.empty((height, width, 3), dtype=np.float32)
+        self.background[:] = self.rgb(canvas['background'])
+        #  ╭────────────────────────────────────────────────────────────────────╮
+        #  │ Time each trail pixel was last drawn, relative to t0 (-inf: never) │
+        #  ╰────────────────────────────────────────────────────────────────────╯
+        self.t0 = time.perf_counter()
+        self.birth = np.full((height, width), -np.inf, dtype=np.float32)
+        #  ╭──────────────────────────────────────────────╮
+        #  │ Ball sprites: centre and color per sprite id │
+        #  ╰──────────────────────────────────────────────╯
+        self.centres = []
+        self.colors = []
+        #  ╭────────────────────────────────────╮
+        #  │ Pixel offsets of a ball-sized disc │
+        #  ╰────────────────────────────────────╯
+        r = ball_radius
+        dy, dx = np.mgrid[-r:r + 1, -r:r + 1]
+        inside = dx * dx + dy * dy <= r * r
+        self.disc_x = dx[inside]
+        self.disc_y = dy[inside]
+        #  ╭─────────────────────────────────────────────────────────────╮
+        #  │ The frame image, below the text items already on the canvas │
+        #  ╰─────────────────────────────────────────────────────────────╯
+        self.header = f'P6 {width} {height} 255 '.encode()
+        self.image = tk.PhotoImage(master=canvas, width=width, height=height)
+        self.item = canvas.create_image(0, 0, anchor='nw', image=self.image)
+        canvas.tag_lower(self.item)
+
+    def rgb(self, color):
+        #  ╭───────────────────────────────────────────────────────────╮
+        #  │ Convert any Tk color name to an (r, g, b) tuple of bytes. │
+        #  ╰───────────────────────────────────────────────────────────╯
+        return tuple(c >> 8 for c in self.canvas.winfo_rgb(color))
+
+    def draw_terrain(self, index, fill):
+        #  ╭─────────────────────────────────────────────────────────────────╮
+        #  │                                                                 │
+        #  │ Paint everything below the terrain surface in `fill`; x between │
+        #  │ breakpoints is interpolated exactly as TerrainIndex does.       │
+        #  │                                                                 │
+        #  ╰─────────────────────────────────────────────────────────────────╯
+        top = np.interp(np.arange(self.width) + 0.5, index.xs, index.ys)
+        rows = np.arange(self.height)[:, None] + 0.5
+        self.background[rows >= top] = self.rgb(fill)
+
+    def add_dot(self, x, y, now):
+        #  ╭───────────────────────────────────────────────────────╮
+        #  │ Draw a 3x3 trail dot centred on (x, y) at time `now`. │
+        #  ╰───────────────────────────────────────────────────────╯
+        x = int(x)
+        y = int(y)
+        self.birth[max(y - 1, 0):y + 2, max(x - 1, 0):x + 2] = now - self.t0
+
+    def create_oval(self, x1, y1, x2, y2, fill, outline=''):
+        #  ╭──────────────────────────────────────╮
+        #  │ Add a ball sprite and return its id. │
+        #  ╰──────────────────────────────────────╯
+        self.centres.append(((x1 + x2) / 2, (y1 + y2) / 2))
+        self.colors.append(self.rgb(fill))
+        return len(self.centres) - 1
+
+    def coords(self, sprite, x1, y1, x2, y2):
+        self.centres[sprite] = ((x1 + x2) / 2, (y1 + y2) / 2)
+
+    def itemconfig(self, sprite, fill):
+        self.colors[sprite] = self.rgb(fill)
+
+    def flush(self, now):
+        #  ╭───────────────────────────────────────────────────────────────╮
+        #  │                                                               │
+        #  │ Compose the frame at time `now` and push it to the image: the │
+        #  │ trail darkens the background by how fresh each pixel is, then │
+        #  │ the balls are stamped on top.                                 │
+        #  │                                                               │
+        #  ╰───────────────────────────────────────────────────────────────╯
+        fresh = 1 - (now - self.t0 - self.birth) / self.lifetime
+        np.clip(fresh, 0, 1, out=fresh)
+        frame = (self.background * (1 - fresh)[..., None]).astype(np.uint8)
+
+        centres = np.array(self.centres)
+        xs = (np.rint(centres[:, 0]).astype(int)[:, None] + self.disc_x).ravel()
+        ys = (np.rint(centres[:, 1]).astype(int)[:, None] + self.disc_y).ravel()
+        colors = np.repeat(np.array(self.colors, dtype=np.uint8),
+                           len(self.disc_x), axis=0)
+        #  ╭────────────────────────────────────────────────────────────────╮
+        #  │ Clip sprites at the edges (hidden ones are entirely off-frame) │
+        #  ╰────────────────────────────────────────────────────────────────╯
+        keep = (xs >= 0) & (xs < self.width) & (ys >= 0) & (ys < self.height)
+        frame[ys[keep], xs[keep]] = colors[keep]
+
+        self.canvas.tk.call(self.image, 'put', self.header + frame.tobytes(),
+                            '-format', 'ppm')
@@ -0,0 +1,357 @@
+# -*- coding: utf-8 -*-
+#  ╭────────────────────────────────────────────────────────────────────╮
+#  │                                                                    │
+#  │ Binary trajectory logs: recording event-engine games and replaying │
+#  │ them with seeking.                                                 │
+#  │                                                                    │
+#  ╰────────────────────────────────────────────────────────────────────╯
+
+import struct
+import math
+import os
+import json
+import zlib
+import mmap
+from bisect import bisect_right
+
+from .config import GameConfig, DEFAULTS
+from .engine import EventEngine
+
+#  ╭──────────────────────────────────────────────────────────────────────╮
+#  │                                                                      │
+#  │ Binary trajectory log layout (all little-endian):                    │
+#  │   header   magic, version, flags, seed, width, height, ball radius,  │
+#  │            gravity and the terrain point count, then the points,     │
+#  │            then the GameConfig as a length-prefixed JSON object      │
+#  │   blocks   runs of up to BLOCK_EVENTS event records, each stored raw │
+#  │            or zlib-compressed; the first record of a block is the    │
+#  │            keyframe a seek starts from                               │
+#  │   index    one entry per block: first time, offset, size, count      │
+#  │   footer   index offset, block count and an end marker               │
+#  │                                                                      │
+#  ╰──────────────────────────────────────────────────────────────────────╯
+LOG_MAGIC = b'BMBR'
+LOG_END = b'BMBI'
+LOG_VERSION = 2
+LOG_COMPRESSED = 1
+LOG_SEEDED = 2
+LOG_HEADER = struct.Struct('<4sHHqddddI')
+LOG_POINT = struct.Struct('<dd')
+LOG_CONFIG = struct.Struct('<I')
+#  ╭─────────────────────────────────────────────────────╮
+#  │ Event record: time, x, y, vx, vy, hit counter, kind │
+#  ╰─────────────────────────────────────────────────────╯
+LOG_EVENT = struct.Struct('<d4diB')
+LOG_INDEX = struct.Struct('<dQII')
+LOG_FOOTER = struct.Struct('<QI4s')
+BLOCK_EVENTS = 256
+#  ╭─────────────────────────────────────────────────────────────────╮
+#  │                                                                 │
+#  │ Event kinds; 'contact' records are samples taken while the ball │
+#  │ slides or is wedged, 'flight' marks the return to free flight   │
+#  │                                                                 │
+#  ╰─────────────────────────────────────────────────────────────────╯
+EVENT_KINDS = ('start', 'left', 'right', 'top', 'terrain',
+               'contact', 'flight', 'rest', 'end')
+
+class Recorder:
+    #  ╭───────────────────────────────────────────────────────────────────╮
+    #  │                                                                   │
+    #  │ Record an EventEngine game to a compact binary log: the seed, the │
+    #  │ terrain and the full ball state after every bounce. Between two   │
+    #  │ events the ball follows an exact parabola, so the log alone is    │
+    #  │ enough to reconstruct the ball at any time. While the ball is in  │
+    #  │ sliding contact the state is checked every `contact_interval`     │
+    #  │ seconds, and sampled only once it has moved `contact_distance`    │
+    #  │ pixels since the last sample or `max_contact_interval` seconds    │
+    #  │ have passed; a ball wedged in a corner for hours then costs one   │
+    #  │ sample a second. The engine skips calling contact() before        │
+    #  │ `next_sample`.                                                    │
+    #  │                                                                   │
+    #  ╰───────────────────────────────────────────────────────────────────╯
+    def __init__(self, path, engine, compress=True, contact_interval=0.01,
+                 contact_distance=0.5, max_contact_interval=1.0):
+        #  ╭─────────────────────────────────────────────────────────╮
+        #  │ Check the seed fits the header before creating the file │
+        #  ╰─────────────────────────────────────────────────────────╯
+        flags = LOG_COMPRESSED if compress else 0
+        seed = engine.seed
+        if isinstance(seed, int):
+            if not -2**63 <= seed < 2**63:
+                raise ValueError('a recorded seed must fit in 64 bits')
+            flags |= LOG_SEEDED
+        else:
+            seed = 0
+        self.file = open(path, 'wb')
+        self.compress = compress
+        self.contact_interval = contact_interval
+        self.contact_distance = contact_distance
+        self.max_contact_interval = max_contact_interval
+        self.block = bytearray()
+        self.block_count = 0
+        self.block_time = 0.0
+        self.index = []
+        self.last_time = 0.0
+        self.next_sample = 0.0
+        self.last_kind = None
+        self.last_pos = (0.0, 0.0)
+
+        surface = engine.terrain_points
+        self.file.write(LOG_HEADER.pack(
+            LOG_MAGIC, LOG_VERSION, flags, seed, engine.width, engine.height,
+            engine.ball_radius, engine.ball_acc[1], len(surface)))
+        for x, y in surface:
+            self.file.write(LOG_POINT.pack(x, y))
+        config = json.dumps(engine.config.as_dict()).encode()
+        self.file.write(LOG_CONFIG.pack(len(config)) + config)
+
+        engine.recorder = self
+        self.record(engine, 'start')
+
+    def record(self, engine, kind):
+        #  ╭──────────────────────────────────────────────────────────╮
+        #  │ Append the engine's current state as an event of `kind`. │
+        #  ╰──────────────────────────────────────────────────────────╯
+        if kind == 'rest' and self.last_kind == 'rest':
+            return
+        if not self.block_count:
+            self.block_time = engine.time
+        x, y = engine.ball_pos
+        vx, vy = engine.ball_vel
+        self.block += LOG_EVENT.pack(engine.time, x, y, vx, vy,
+                                     engine.counter, EVENT_KINDS.index(kind))
+        self.block_count += 1
+        self.last_time = engine.time
+        self.next_sample = engine.time + self.contact_interval
+        self.last_kind = kind
+        self.last_pos = (x, y)
+        if self.block_count == BLOCK_EVENTS:
+            self.flush()
+
+    def contact(self, engine, hit):
+        #  ╭────────────────────────────────────────────────────────────╮
+        #  │                                                            │
+        #  │ Called on every fixed step taken in sliding contact; keeps │
+        #  │ every ceiling hit and the samples described above.         │
+        #  │                                                            │
+        #  ╰────────────────────────────────────────────────────────────╯
+        if hit:
+            self.record(engine, 'top')
+            return
+        if engine.time < self.next_sample:
+            return
+        x, y = engine.ball_pos
+        moved = math.hypot(x - self.last_pos[0], y - self.last_pos[1])
+        if moved >= self.contact_distance \
+                or engine.time - self.last_time >= self.max_contact_interval:
+            self.record(engine, 'contact')
+        else:
+            self.next_sample = engine.time + self.contact_interval
+
+    def flush(self):
+        #  ╭─────────────────────────────────────────────────────╮
+        #  │ Write the pending block and remember where it went. │
+        #  ╰─────────────────────────────────────────────────────╯
+        if not self.block_count:
+            return
+        data = zlib.compress(bytes(self.block)) if self.compress \
+            else bytes(self.block)
+        self.index.append((self.block_time, self.file.tell(), len(data),
+                           self.block_count))
+        self.file.write(data)
+        self.block = bytearray()
+        self.block_count = 0
+
+    def close(self, engine):
+        #  ╭────────────────────────────────────────────────────────────────╮
+        #  │ Record the final state, then write the block index and footer. │
+        #  ╰────────────────────────────────────────────────────────────────╯
+        self.record(engine, 'end')
+        self.flush()
+        index_offset = self.file.tell()
+        for entry in self.index:
+            self.file.write(LOG_INDEX.pack(*entry))
+        self.file.write(LOG_FOOTER.pack(index_offset, len(self.index),
+                                        LOG_END))
+        self.file.close()
+        engine.recorder = None
+
+class Replay:
+    #  ╭────────────────────────────────────────────────────────────────────╮
+    #  │                                                                    │
+    #  │ Read a log written by Recorder. The file is memory mapped and only │
+    #  │ the block index is parsed up front; state_at() bisects the index   │
+    #  │ for the keyframe block covering a time, decodes just that block    │
+    #  │ and moves the ball analytically from the last event, so seeking    │
+    #  │ anywhere in a many-hour recording is instant.                      │
+    #  │                                                                    │
+    #  ╰────────────────────────────────────────────────────────────────────╯
+    def __init__(self, path):
+        self.file = open(path, 'rb')
+        #  ╭───────────────────────────────────────────────────────────────────╮
+        #  │ Too short for a header and footer (mmap also refuses empty files) │
+        #  ╰───────────────────────────────────────────────────────────────────╯
+        if os.fstat(self.file.fileno()).st_size < \
+                LOG_HEADER.size + LOG_FOOTER.size:
+            self.file.close()
+            raise ValueError(f'{path} is not a ball trajectory log')
+        self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        (magic, version, flags, seed, self.width, self.height,
+         self.ball_radius, _, points) = \
+            LOG_HEADER.unpack_from(self.map, 0)
+        if magic != LOG_MAGIC or version != LOG_VERSION:
+            raise ValueError(f'{path} is not a ball trajectory log')
+        self.compressed = bool(flags & LOG_COMPRESSED)
+        self.seed = seed if flags & LOG_SEEDED else None
+        offset = LOG_HEADER.size
+        self.terrain_points = [
+            LOG_POINT.unpack_from(self.map, offset + i * LOG_POINT.size)
+            for i in range(points)
+        ]
+        offset += points * LOG_POINT.size
+        (size,) = LOG_CONFIG.unpack_from(self.map, offset)
+        offset += LOG_CONFIG.size
+        self.config = GameConfig(**json.loads(self.map[offset:offset + size]))
+
+        index_offset, blocks, end = LOG_FOOTER.unpack_from(
+            self.map, len(self.map) - LOG_FOOTER.size)
+        if end != LOG_END:
+            raise ValueError(f'{path} is truncated (no block index)')
+        self.index = [
+            LOG_INDEX.unpack_from(self.map, index_offset + i * LOG_INDEX.size)
+            for i in range(blocks)
+        ]
+        self.block_times = [entry[0] for entry in self.index]
+        self.cached = (None, None, None)
+
+    def __len__(self):
+        return sum(entry[3] for entry in self.index)
+
+    def close(self):
+        self.map.close()
+        self.file.close()
+
+    def block(self, i):
+        #  ╭───────────────────────────────────────────────────────────────╮
+        #  │ Decode block i into (times, records); the last one is cached. │
+        #  ╰───────────────────────────────────────────────────────────────╯
+        if self.cached[0] == i:
+            return self.cached[1], self.cached[2]
+        _, offset, size, count = self.index[i]
+        data = self.map[offset:offset + size]
+        if self.compressed:
+            data = zlib.decompress(data)
+        records = [LOG_EVENT.unpack_from(data, k * LOG_EVENT.size)
+                   for k in range(count)]
+        times = [record[0] for record in records]
+        self.cached = (i, times, records)
+        return times, records
+
+    def events(self):
+        #  ╭──────────────────────────────────────────────────────────────────╮
+        #  │ Iterate over every event as (time, x, y, vx, vy, counter, kind). │
+        #  ╰──────────────────────────────────────────────────────────────────╯
+        for i in range(len(self.index)):
+            for t, x, y, vx, vy, counter, kind in self.block(i)[1]:
+                yield t, x, y, vx, vy, counter, EVENT_KINDS[kind]
+
+    @property
+    def duration(self):
+        #  ╭──────────────────────────────────╮
+        #  │ Time of the last recorded event. │
+        #  ╰──────────────────────────────────╯
+        times, _ = self.block(len(self.index) - 1)
+        return times[-1]
+
+    def record_before(self, t):
+        #  ╭────────────────────────────────────────────────────────────────╮
+        #  │                                                                │
+        #  │ Return the last event at or before time t and the one after it │
+        #  │ (None at the end of the log).                                  │
+        #  │                                                                │
+        #  ╰────────────────────────────────────────────────────────────────╯
+        i = max(bisect_right(self.block_times, t) - 1, 0)
+        times, records = self.block(i)
+        k = max(bisect_right(times, t) - 1, 0)
+        if k + 1 < len(records):
+            return records[k], records[k + 1]
+        if i + 1 < len(self.index):
+            return records[k], self.block(i + 1)[1][0]
+        return records[k], None
+
+    def state_at(self, t):
+        #  ╭─────────────────────────────────────────────────────────────╮
+        #  │                                                             │
+        #  │ Reconstruct the ball at time t as a dict of time, position, │
+        #  │ velocity and hit counter.                                   │
+        #  │                                                             │
+        #  ╰─────────────────────────────────────────────────────────────╯
+        record, following = self.record_before(t)
+        t0, x, y, vx, vy, counter, kind = record
+        kind = EVENT_KINDS[kind]
+        dt = max(t - t0, 0.0)
+        time = t0 + dt
+        if kind in ('rest', 'end'):
+            #  ╭───────────────────────────────────────────────────────────╮
+            #  │ The ball stays put from here on, up to the end of the log │
+            #  ╰───────────────────────────────────────────────────────────╯
+            time = min(time, self.duration)
+            dt = 0.0
+        elif following and 'contact' in (kind, EVENT_KINDS[following[6]]):
+            #  ╭────────────────────────────────────────────────────────────╮
+            #  │                                                            │
+            #  │ Sliding contact (which the ball enters without an event of │
+            #  │ its own): interpolate between the samples                  │
+            #  │                                                            │
+            #  ╰────────────────────────────────────────────────────────────╯
+            span = following[0] - t0
+            f = dt / span if span > 0 else 0.0
+            x += (following[1] - x) * f
+            y += (following[2] - y) * f
+            vx += (following[3] - vx) * f
+            vy += (following[4] - vy) * f
+            dt = 0.0
+        return {
+            'time': time,
+            'x': x + vx * dt,
+            'y': y + (vy + 0.5 * self.config.gravity * dt) * dt,
+            'vx': vx,
+            'vy': vy + self.config.gravity * dt,
+            'hits': counter,
+        }
+
+    def verify(self):
+        #  ╭──────────────────────────────────────────────────────────────────╮
+        #  │                                                                  │
+        #  │ Re-simulate the recorded game from its seed or terrain, with its │
+        #  │ config, and check that it reproduces the recorded final score.   │
+        #  │                                                                  │
+        #  ╰──────────────────────────────────────────────────────────────────╯
+        #  ╭────────────────────────────────────────────────────────────────╮
+        #  │                                                                │
+        #  │ Set the logged size as load_terrain does: the header stores it │
+        #  │ as floats, which the terrain generator cannot take             │
+        #  │                                                                │
+        #  ╰────────────────────────────────────────────────────────────────╯
+        engine = EventEngine(config=self.config)
+        engine.width, engine.height = self.width, self.height
+        engine.seed = self.seed
+        engine.set_terrain(self.terrain_points)
+        engine.reset()
+        final = self.state_at(self.duration)
+        engine.run(final['time'])
+        return engine.counter == final['hits']
+
+def record_headless(path, duration=120, seed=None, compress=True,
+                    config=DEFAULTS):
+    #  ╭──────────────────────────────────────────────────────────────────╮
+    #  │                                                                  │
+    #  │ Play a headless game on the event-driven engine, recording it to │
+    #  │ `path`. Returns the score.                                       │
+    #  │                                                                  │
+    #  ╰──────────────────────────────────────────────────────────────────╯
+    engine = EventEngine(seed=seed, config=config)
+    recorder = Recorder(path, engine, compress)
+    engine.run(duration)
+    recorder.close(engine)
+    return engine.results()
@@ -0,0 +1,203 @@
+# -*- coding: utf-8 -*-
+#  ╭───────────────────────────────────────────────────────────────────╮
+#  │                                                                   │
+#  │ Parameter sweeps over GameConfig, searching for the settings with │
+#  │ the highest HPM.                                                  │
+#  │                                                                   │
+#  ╰───────────────────────────────────────────────────────────────────╯
+
+import random
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from .config import GameConfig, DEFAULTS
+from .engine import ENGINES
+
+def parse_space(specs):
+    #  ╭────────────────────────────────────────────────────────────────────╮
+    #  │                                                                    │
+    #  │ Parse sweep specs "FIELD=LO:HI[:N]" or "FIELD=A,B,..." into a dict │
+    #  │ of field -> (lo, hi, n) range or list of values. N (default 5) is  │
+    #  │ the number of grid points; random search draws from [LO, HI].      │
+    #  │                                                                    │
+    #  ╰────────────────────────────────────────────────────────────────────╯
+    space = {}
+    for spec in specs:
+        name, _, values = spec.partition('=')
+        if name not in GameConfig.fields:
+            raise ValueError(f'unknown config field {name!r}; expected one '
+                             f'of {", ".join(GameConfig.fields)}')
+        if ':' in values:
+            parts = values.split(':')
+            lo, hi = float(parts[0]), float(parts[1])
+            space[name] = (lo, hi, int(parts[2]) if len(parts) > 2 else 5)
+        else:
+            space[name] = [float(v) for v in values.split(',')]
+    return space
+
+def sweep_candidates(space, search='grid', samples=32, seed=None,
+                     base=DEFAULTS):
+    #  ╭────────────────────────────────────────────────────────────────╮
+    #  │                                                                │
+    #  │ List the configs to try: every grid combination, or `samples`  │
+    #  │ distinct random draws. Fields missing from `space` keep their  │
+    #  │ `base` values and combinations GameConfig rejects are skipped. │
+    #  │                                                                │
+    #  ╰────────────────────────────────────────────────────────────────╯
+    rng = random.Random(seed)
+    names = list(space)
+    if search == 'grid':
+        axes = []
+        for name in names:
+            values = space[name]
+            if isinstance(values, tuple):
+                lo, hi, n = values
+                values = [lo + (hi - lo) * i / max(n - 1, 1) for i in range(n)]
+            axes.append(values)
+        combos = [[]]
+        for values in axes:
+            combos = [combo + [v] for combo in combos for v in values]
+    else:
+        #  ╭────────────────────────────────────────────────────────────╮
+        #  │ Draw lazily, with headroom for rejected and repeated draws │
+        #  ╰────────────────────────────────────────────────────────────╯
+        combos = ([rng.uniform(*space[name][:2])
+                   if isinstance(space[name], tuple)
+                   else rng.choice(space[name]) for name in names]
+                  for _ in range(samples * 20))
+
+    candidates = []
+    seen = set()
+    for combo in combos:
+        try:
+            config = base.replace(**dict(zip(names, combo)))
+        except ValueError:
+            continue
+        #  ╭─────────────────────────────────────────────────────────╮
+        #  │ Integer fields can make different draws the same config │
+        #  ╰─────────────────────────────────────────────────────────╯
+        if config not in seen:
+            seen.add(config)
+            candidates.append(config)
+            if search != 'grid' and len(candidates) == samples:
+                break
+    return candidates
+
+class SweepCache:
+    #  ╭─────────────────────────────────────────────────────────────────────╮
+    #  │                                                                     │
+    #  │ Scores of past sweep evaluations, keyed by config, seed, engine and │
+    #  │ game length, in a JSON Lines file that grows as evaluations finish  │
+    #  │ so an interrupted or repeated sweep never re-simulates a game.      │
+    #  │                                                                     │
+    #  ╰─────────────────────────────────────────────────────────────────────╯
+    def __init__(self, path):
+        self.results = {}
+        if os.path.exists(path):
+            end = 0
+            with open(path, 'rb') as f:
+                for line in f:
+                    #  ╭─────────────────────────────────────────────────────╮
+                    #  │ A sweep killed mid-write leaves a partial last line │
+                    #  ╰─────────────────────────────────────────────────────╯
+                    if not line.endswith(b'\n'):
+                        break
+                    end += len(line)
+                    try:
+                        row = json.loads(line)
+                    except ValueError:
+                        continue
+                    self.results[row['key']] = row['score']
+            os.truncate(path, end)
+        self.file = open(path, 'a')
+
+    @staticmethod
+    def key(config, seed, engine, duration):
+        return json.dumps([config.as_dict(), seed, engine, duration],
+                          sort_keys=True)
+
+    def __contains__(self, key):
+        return key in self.results
+
+    def __getitem__(self, key):
+        return self.results[key]
+
+    def put(self, key, score):
+        self.results[key] = score
+        self.file.write(json.dumps({'key': key, 'score': score}) + '\n')
+        self.file.flush()
+
+    def close(self):
+        self.file.close()
+
+def _score_config(job):
+    #  ╭─────────────────────────────────────────────────────────────────╮
+    #  │                                                                 │
+    #  │ Score one (config, seed) sweep job in a worker process. A game  │
+    #  │ that raises, e.g. overflowing on extreme settings, is scored as │
+    #  │ an error instead of taking the whole pool down.                 │
+    #  │                                                                 │
+    #  ╰─────────────────────────────────────────────────────────────────╯
+    config, seed, engine, duration = job
+    try:
+        game = ENGINES[engine](seed=seed, config=config)
+        game.run(duration)
+    except Exception as error:
+        return {'error': f'{type(error).__name__}: {error}'}
+    score = game.results()
+    return {'hits': score['hits'], 'time': score['time'], 'hpm': score['hpm']}
+
+def run_sweep(candidates, seeds, duration=120, engine='event', workers=None,
+              prune=0.5, cache='sweep-cache.jsonl', progress=None):
+    #  ╭───────────────────────────────────────────────────────────────────╮
+    #  │                                                                   │
+    #  │ Score every candidate GameConfig on the same seeds, one seed per  │
+    #  │ round with each round's games spread over a process pool. After a │
+    #  │ round, candidates whose mean HPM is below `prune` times the       │
+    #  │ leader's are dropped, so clearly bad settings cost a game or two  │
+    #  │ instead of the full set. A candidate whose game fails is dropped  │
+    #  │ from the sweep and the ranking. Scores are looked up in and added │
+    #  │ to the `cache` file. After each round `progress`, if given, is    │
+    #  │ called with the seed, the number of candidates still in and the   │
+    #  │ number of games simulated. Returns (mean HPM, config, seeds       │
+    #  │ played) tuples, best first.                                       │
+    #  │                                                                   │
+    #  ╰───────────────────────────────────────────────────────────────────╯
+    cache = SweepCache(cache)
+    scores = [[] for _ in candidates]
+    failed = set()
+    alive = list(range(len(candidates)))
+    workers = workers or os.cpu_count() or 1
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for round_, seed in enumerate(seeds):
+                keys = {i: SweepCache.key(candidates[i], seed, engine, duration)
+                        for i in alive}
+                todo = [i for i in alive if keys[i] not in cache]
+                jobs = [(candidates[i], seed, engine, duration) for i in todo]
+                chunksize = max(1, len(jobs) // (workers * 4))
+                for i, score in zip(todo, pool.map(_score_config, jobs,
+                                                   chunksize=chunksize)):
+                    cache.put(keys[i], score)
+                for i in alive:
+                    if 'error' in cache[keys[i]]:
+                        failed.add(i)
+                    else:
+                        scores[i].append(cache[keys[i]]['hpm'])
+                alive = [i for i in alive if i not in failed]
+                if progress:
+                    progress(seed, len(alive), len(todo))
+                #  ╭───────────────────────────────────────────────────────╮
+                #  │ Early stopping: drop candidates far behind the leader │
+                #  ╰───────────────────────────────────────────────────────╯
+                if alive and round_ < len(seeds) - 1:
+                    means = {i: sum(scores[i]) / len(scores[i]) for i in alive}
+                    best = max(means.values())
+                    alive = [i for i in alive if means[i] >= prune * best]
+    finally:
+        cache.close()
+    ranking = [(sum(s) / len(s), candidates[i], len(s))
+               for i, s in enumerate(scores) if s and i not in failed]
+    ranking.sort(key=lambda entry: (-entry[2], -entry[0]))
+    return ranking
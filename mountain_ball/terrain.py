@@ -0,0 +1,189 @@
+# -*- coding: utf-8 -*-
+#  ╭────────────────────────────────────────────────────────────────────╮
+#  │                                                                    │
+#  │ Terrain: generation of the playfield floor, the segment index used │
+#  │ for collisions, and endless terrain built in chunks on demand.     │
+#  │                                                                    │
+#  ╰────────────────────────────────────────────────────────────────────╯
+
+import random
+import math
+from bisect import bisect_left
+from collections import OrderedDict
+
+from .config import DEFAULTS
+
+def generate_terrain(width, height, rng=random, config=DEFAULTS):
+    #  ╭───────────────────────────────────────────────────────────────────╮
+    #  │                                                                   │
+    #  │ Generate random terrain points along the bottom of the playfield, │
+    #  │ closed at the bottom edges so it can be drawn as a polygon.       │
+    #  │                                                                   │
+    #  ╰───────────────────────────────────────────────────────────────────╯
+    points = []
+    x = 0
+    while x <= width:
+        #  ╭───────────────────────────────────────────────────╮
+        #  │ Generate a random y-coordinate for terrain height │
+        #  ╰───────────────────────────────────────────────────╯
+        y = rng.randint(height - config.terrain_band, height)
+        points.append((x, y))
+        x += rng.randint(config.spacing_min, config.spacing_max)
+    #  ╭───────────────────────────────────────────╮
+    #  │ Ensure the terrain reaches the right edge │
+    #  ╰───────────────────────────────────────────╯
+    if points[-1][0] < width:
+        points.append((width, points[-1][1]))
+    #  ╭───────────────────────────────────────╮
+    #  │ Close the polygon at the bottom edges │
+    #  ╰───────────────────────────────────────╯
+    points.append((width, height))
+    points.append((0, height))
+    return points
+
+class TerrainIndex:
+    #  ╭────────────────────────────────────────────────────────────────────╮
+    #  │                                                                    │
+    #  │ Precomputed lookup over the terrain surface (the terrain points    │
+    #  │ without the closing bottom edges). The x breakpoints are sorted by │
+    #  │ construction, so the segment under any x is found by bisection in  │
+    #  │ O(log n), and each segment's slope and intercept are stored so the │
+    #  │ terrain height is a single multiply-add. Unit normals are stored   │
+    #  │ too, so a bounce needs no square root or division.                 │
+    #  │                                                                    │
+    #  ╰────────────────────────────────────────────────────────────────────╯
+    __slots__ = ('xs', 'ys', 'top', 'slopes', 'intercepts', 'nx', 'ny',
+                 'last')
+
+    def __init__(self, surface):
+        self.xs = [x for x, _ in surface]
+        self.ys = [y for _, y in surface]
+        #  ╭───────────────────────────────────────────╮
+        #  │ Highest point of the surface (smallest y) │
+        #  ╰───────────────────────────────────────────╯
+        self.top = min(self.ys)
+        #  ╭──────────────────────────────────────────────────────────╮
+        #  │ Per-segment line coefficients: y = slope * x + intercept │
+        #  ╰──────────────────────────────────────────────────────────╯
+        self.slopes = []
+        self.intercepts = []
+        #  ╭───────────────────────────────────────────────────────────╮
+        #  │ Per-segment unit normals (pointing up out of the terrain) │
+        #  ╰───────────────────────────────────────────────────────────╯
+        self.nx = []
+        self.ny = []
+        for i in range(len(surface) - 1):
+            x1, y1 = surface[i]
+            x2, y2 = surface[i+1]
+            m = (y2 - y1) / (x2 - x1) if x2 != x1 else 0.0
+            self.slopes.append(m)
+            self.intercepts.append(y1 - m * x1)
+            length = math.hypot(x2 - x1, y2 - y1)
+            self.nx.append(-(y2 - y1) / length)
+            self.ny.append((x2 - x1) / length)
+        self.last = len(self.slopes) - 1
+
+    def segment_at(self, x):
+        #  ╭────────────────────────────────────────────────────────────────╮
+        #  │                                                                │
+        #  │ Return the index of the segment under x, or -1 if x is off the │
+        #  │ terrain. On a breakpoint the left-hand segment wins.           │
+        #  │                                                                │
+        #  ╰────────────────────────────────────────────────────────────────╯
+        if x < self.xs[0] or x > self.xs[-1]:
+            return -1
+        i = bisect_left(self.xs, x) - 1
+        return i if i >= 0 else 0
+
+    def height_at(self, x):
+        #  ╭─────────────────────────────────────────────────────────────────╮
+        #  │ Return the terrain y-coordinate at x (None if off the terrain). │
+        #  ╰─────────────────────────────────────────────────────────────────╯
+        i = self.segment_at(x)
+        if i < 0:
+            return None
+        return self.slopes[i] * x + self.intercepts[i]
+
+    def segment(self, i):
+        #  ╭────────────────────────────────────────────────╮
+        #  │ Return segment i as an (x1, y1, x2, y2) tuple. │
+        #  ╰────────────────────────────────────────────────╯
+        return (self.xs[i], self.ys[i], self.xs[i+1], self.ys[i+1])
+
+class ChunkedTerrain:
+    #  ╭───────────────────────────────────────────────────────────────────╮
+    #  │                                                                   │
+    #  │ Endless terrain generated lazily in fixed-width chunks. Chunk k   │
+    #  │ spans x = k * chunk_width to (k + 1) * chunk_width and is built   │
+    #  │ from its own generator seeded with (seed, k), so any chunk can be │
+    #  │ regenerated identically at any time; the heights at the chunk     │
+    #  │ edges come from their own seeds so neighbouring chunks join up.   │
+    #  │ Built chunks live in an LRU cache of `cache_size` entries, which  │
+    #  │ keeps memory constant however far the ball travels.               │
+    #  │                                                                   │
+    #  ╰───────────────────────────────────────────────────────────────────╯
+    def __init__(self, seed, height=300, chunk_width=800, cache_size=8,
+                 config=DEFAULTS):
+        self.seed = seed
+        self.height = height
+        self.config = config
+        self.chunk_width = chunk_width
+        self.cache_size = cache_size
+        self.chunks = OrderedDict()
+
+    def edge_height(self, k):
+        #  ╭─────────────────────────────────────────────────────────────╮
+        #  │ Terrain height where chunk k starts (and chunk k - 1 ends). │
+        #  ╰─────────────────────────────────────────────────────────────╯
+        rng = random.Random(f'{self.seed}/edge/{k}')
+        return rng.randint(self.height - self.config.terrain_band, self.height)
+
+    def generate(self, k):
+        #  ╭─────────────────────────────────────────────────────────────╮
+        #  │                                                             │
+        #  │ Build the surface of chunk k, with the same height band and │
+        #  │ point spacing as generate_terrain.                          │
+        #  │                                                             │
+        #  ╰─────────────────────────────────────────────────────────────╯
+        rng = random.Random(f'{self.seed}/chunk/{k}')
+        start = k * self.chunk_width
+        end = start + self.chunk_width
+        low = self.height - self.config.terrain_band
+        spacing = (self.config.spacing_min, self.config.spacing_max)
+        points = [(start, self.edge_height(k))]
+        x = start + rng.randint(*spacing)
+        while x < end:
+            points.append((x, rng.randint(low, self.height)))
+            x += rng.randint(*spacing)
+        points.append((end, self.edge_height(k + 1)))
+        return points
+
+    def chunk(self, k):
+        #  ╭─────────────────────────────────────────────────────────────╮
+        #  │                                                             │
+        #  │ Return the TerrainIndex of chunk k, generating it on a miss │
+        #  │ and evicting the least recently used chunk when full.       │
+        #  │                                                             │
+        #  ╰─────────────────────────────────────────────────────────────╯
+        chunks = self.chunks
+        index = chunks.get(k)
+        if index is None:
+            index = TerrainIndex(self.generate(k))
+            chunks[k] = index
+            if len(chunks) > self.cache_size:
+                chunks.popitem(last=False)
+        else:
+            chunks.move_to_end(k)
+        return index
+
+    def chunk_at(self, x):
+        #  ╭───────────────────────────────────────────────╮
+        #  │ Return the TerrainIndex of the chunk under x. │
+        #  ╰───────────────────────────────────────────────╯
+        return self.chunk(math.floor(x / self.chunk_width))
+
+    def height_at(self, x):
+        #  ╭───────────────────────────────────────╮
+        #  │ Return the terrain y-coordinate at x. │
+        #  ╰───────────────────────────────────────╯
+        return self.chunk_at(x).height_at(x)
@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+#  ╭──────────────────────────────────────────────────────────╮
+#  │ Ring buffer recycling the trail dots of the game window. │
+#  ╰──────────────────────────────────────────────────────────╯
+
+from collections import deque
+
+class TrailBuffer:
+    #  ╭────────────────────────────────────────────────────────────────────╮
+    #  │                                                                    │
+    #  │ Fixed-capacity ring buffer of trail dots. Dots are added in        │
+    #  │ timestamp order, so expired ones are always at the front and are   │
+    #  │ popped in O(1). The buffer owns a pool of pre-created item ids     │
+    #  │ (canvas items in the game window) that are recycled rather than    │
+    #  │ created and deleted; when every item is in use the oldest live dot │
+    #  │ is reused.                                                         │
+    #  │                                                                    │
+    #  ╰────────────────────────────────────────────────────────────────────╯
+    def __init__(self, items, lifetime=5):
+        #  ╭──────────────────────────────────────────────╮
+        #  │ Live dots as (item, timestamp), oldest first │
+        #  ╰──────────────────────────────────────────────╯
+        self.dots = deque()
+        #  ╭───────────────────────────────────╮
+        #  │ Items not currently showing a dot │
+        #  ╰───────────────────────────────────╯
+        self.free = deque(items)
+        self.capacity = len(self.free)
+        self.lifetime = lifetime
+
+    def __len__(self):
+        return len(self.dots)
+
+    def add(self, timestamp):
+        #  ╭───────────────────────────────────────────────────────────────╮
+        #  │                                                               │
+        #  │ Claim an item for a new dot created at `timestamp` and return │
+        #  │ it; the caller moves the item to the dot's position. A buffer │
+        #  │ without items keeps no trail and returns None.                │
+        #  │                                                               │
+        #  ╰───────────────────────────────────────────────────────────────╯
+        if self.free:
+            item = self.free.popleft()
+        elif self.dots:
+            item = self.dots.popleft()[0]
+        else:
+            return None
+        self.dots.append((item, timestamp))
+        return item
+
+    def expire(self, now):
+        #  ╭───────────────────────────────────────────────────────────╮
+        #  │                                                           │
+        #  │ Release the dots older than the lifetime and return their │
+        #  │ items so the caller can hide them.                        │
+        #  │                                                           │
+        #  ╰───────────────────────────────────────────────────────────╯
+        expired = []
+        dots = self.dots
+        cutoff = now - self.lifetime
+        while dots and dots[0][1] < cutoff:
+            item = dots.popleft()[0]
+            self.free.append(item)
+            expired.append(item)
+        return expired
@@ -0,0 +1,197 @@
+# -*- coding: utf-8 -*-
+#  ╭──────────────────────────────────────────────────────────────────╮
+#  │                                                                  │
+#  │ Vectorized Monte Carlo engine: many independent balls stepped at │
+#  │ once with NumPy.                                                 │
+#  │                                                                  │
+#  ╰──────────────────────────────────────────────────────────────────╯
+
+import random
+
+try:
+    import numpy as np
+except ImportError:
+    #  ╭────────────────────────────────────────────────────────────────╮
+    #  │                                                                │
+    #  │ NumPy is optional: without it the other engines still run, and │
+    #  │ VectorEngine raises RuntimeError                               │
+    #  │                                                                │
+    #  ╰────────────────────────────────────────────────────────────────╯
+    np = None
+
+from .config import DEFAULTS
+from .terrain import generate_terrain, TerrainIndex
+
+class VectorEngine:
+    #  ╭──────────────────────────────────────────────────────────────────────╮
+    #  │                                                                      │
+    #  │ Multi-ball engine for Monte Carlo scoring of a terrain. The state    │
+    #  │ of N balls is held in contiguous NumPy arrays (row 0 = x, row 1 = y) │
+    #  │ and every step applies gravity, wall reflection, terrain collision   │
+    #  │ and restitution to all balls at once, with the same rules as         │
+    #  │ BallEngine. Requires NumPy.                                          │
+    #  │                                                                      │
+    #  ╰──────────────────────────────────────────────────────────────────────╯
+    def __init__(self, n_balls, width=800, height=300,
+                 terrain_points=None, seed=None, config=DEFAULTS):
+        if np is None:
+            raise RuntimeError('VectorEngine requires NumPy')
+        self.n_balls = n_balls
+        self.width = width
+        self.height = height
+        self.ball_radius = 4
+        self.time_step = 0.001
+        self.config = config
+        self.gravity = config.gravity
+        self.rng = np.random.default_rng(seed)
+
+        #  ╭────────────────────────────────────────────────────────────────╮
+        #  │ Terrain: generate one unless the caller shares an existing one │
+        #  ╰────────────────────────────────────────────────────────────────╯
+        if terrain_points is None:
+            terrain_points = generate_terrain(width, height, random.Random(seed),
+                                              config)
+        self.terrain_points = terrain_points
+        index = TerrainIndex(terrain_points[:-2])
+        self.xs = np.array(index.xs, dtype=float)
+        self.slopes = np.array(index.slopes)
+        self.intercepts = np.array(index.intercepts)
+        #  ╭────────────────────────────────────────────────────────────────╮
+        #  │ Highest terrain point: balls above it cannot touch the terrain │
+        #  ╰────────────────────────────────────────────────────────────────╯
+        self.y_top = min(index.ys)
+        #  ╭────────────────────────────────────────────────────────╮
+        #  │ Per-segment unit normals, as used by resolve_collision │
+        #  ╰────────────────────────────────────────────────────────╯
+        self.nx = np.array(index.nx)
+        self.ny = np.array(index.ny)
+        self.reset()
+
+    def reset(self):
+        #  ╭───────────────────────────────────────────────────────────╮
+        #  │                                                           │
+        #  │ Drop every ball from the top wall at a random x with zero │
+        #  │ velocity and reset the per-ball hit counters.             │
+        #  │                                                           │
+        #  ╰───────────────────────────────────────────────────────────╯
+        r = self.ball_radius
+        self.pos = np.zeros((2, self.n_balls))
+        self.pos[0] = self.rng.uniform(r, self.width - r, self.n_balls)
+        self.vel = np.zeros((2, self.n_balls))
+        #  ╭─────────────────────────────────────────────────────────╮
+        #  │ Per-ball hit counters (start at -1 to offset first hit) │
+        #  ╰─────────────────────────────────────────────────────────╯
+        self.counters = np.full(self.n_balls, -1, dtype=np.int64)
+        self.steps = 0
+
+    @property
+    def elapsed(self):
+        #  ╭────────────────────────────╮
+        #  │ Simulated time in seconds. │
+        #  ╰────────────────────────────╯
+        return self.steps * self.time_step
+
+    def step(self):
+        #  ╭─────────────────────────────────────╮
+        #  │ Advance all balls by one time step. │
+        #  ╰─────────────────────────────────────╯
+        dt = self.time_step
+        r = self.ball_radius
+        x, y = self.pos
+        vx, vy = self.vel
+
+        #  ╭───────────────────────────────────────────────╮
+        #  │ Update velocity and position based on physics │
+        #  ╰───────────────────────────────────────────────╯
+        vy += self.gravity * dt
+        x += vx * dt
+        y += vy * dt
+
+        #  ╭────────────────────────────────╮
+        #  │ Left and right wall collisions │
+        #  ╰────────────────────────────────╯
+        half = self.width / 2
+        wall = np.abs(x - half) >= half - r
+        if wall.any():
+            np.clip(x, r, self.width - r, out=x)
+            vx[wall] *= -self.config.wall_damping
+        #  ╭──────────────────────────────────╮
+        #  │ Top wall collision: count as hit │
+        #  ╰──────────────────────────────────╯
+        top = y <= r
+        if top.any():
+            y[top] = r
+            vy[top] *= -self.config.wall_damping
+            self.counters[top] += 1
+
+        #  ╭───────────────────────────────────────────────────────────────╮
+        #  │                                                               │
+        #  │ Terrain collision: only balls low enough to touch the terrain │
+        #  │ are tested, each finding its segment by binary search         │
+        #  │                                                               │
+        #  ╰───────────────────────────────────────────────────────────────╯
+        near = np.flatnonzero(y >= self.y_top - r)
+        if near.size:
+            near_x = x[near]
+            seg = np.searchsorted(self.xs, near_x, side='left') - 1
+            np.clip(seg, 0, len(self.slopes) - 1, out=seg)
+            y_terrain = self.slopes[seg] * near_x + self.intercepts[seg]
+            inside = y[near] + r >= y_terrain
+            if inside.any():
+                hit = near[inside]
+                seg = seg[inside]
+                nx = self.nx[seg]
+                ny = self.ny[seg]
+                hvx = vx[hit]
+                hvy = vy[hit]
+                #  ╭───────────────────────────────────────────────────────╮
+                #  │ Reflect the velocity and apply the energy adjustments │
+                #  ╰───────────────────────────────────────────────────────╯
+                v_dot_n = hvx * nx + hvy * ny
+                vx[hit] = (hvx - 2 * v_dot_n * nx) * self.config.restitution_x
+                vy[hit] = (hvy - 2 * v_dot_n * ny) * self.config.restitution_y
+                #  ╭────────────────────────────────────────╮
+                #  │ Push the balls back out of the terrain │
+                #  ╰────────────────────────────────────────╯
+                y[hit] = y_terrain[inside] - r
+
+        self.steps += 1
+
+    def run(self, seconds):
+        #  ╭───────────────────────────────────────────────────────────╮
+        #  │                                                           │
+        #  │ Step all balls for the given number of simulated seconds. │
+        #  │ Returns the per-ball hit counters.                        │
+        #  │                                                           │
+        #  ╰───────────────────────────────────────────────────────────╯
+        for _ in range(int(round(seconds / self.time_step))):
+            self.step()
+        return self.counters
+
+    def results(self):
+        #  ╭──────────────────────────────────────────────────────────╮
+        #  │ Summarise the run: per-ball hit statistics and mean HPM. │
+        #  ╰──────────────────────────────────────────────────────────╯
+        run_time = self.elapsed
+        hits = self.counters
+        mean = float(hits.mean())
+        return {
+            'balls': self.n_balls,
+            'time': run_time,
+            'hits_mean': mean,
+            'hits_std': float(hits.std()),
+            'hits_min': int(hits.min()),
+            'hits_max': int(hits.max()),
+            'hpm': (mean / run_time * 60) if run_time > 0 else 0,
+        }
+
+def run_monte_carlo(n_balls, duration=120, seed=None, config=DEFAULTS):
+    #  ╭─────────────────────────────────────────────────────────────────╮
+    #  │                                                                 │
+    #  │ Score one random terrain with n_balls balls dropped from random │
+    #  │ positions and return the aggregated results.                    │
+    #  │                                                                 │
+    #  ╰─────────────────────────────────────────────────────────────────╯
+    engine = VectorEngine(n_balls, seed=seed, config=config)
+    engine.run(duration)
+    return engine.results()
@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+#  ╭─────────────────────────────╮
+#  │ Tests for the command line. │
+#  ╰─────────────────────────────╯
+
+import pytest
+
+from mountain_ball.cli import legacy_argv, parse_args
+
+@pytest.mark.parametrize('argv, expected', [
+    ([], ['gui']),
+    (['--seed', '3'], ['gui', '--seed', '3']),
+    (['--headless', '--seed', '3'], ['headless', '--seed', '3']),
+    (['--bench', '--seed', '2'], ['bench', '--seed', '2']),
+    (['--replay', 'f.bmb', '--at', '1'], ['replay', 'f.bmb', '--at', '1']),
+    (['--record', 'g.bmb', '--duration', '5'],
+     ['record', 'g.bmb', '--duration', '5']),
+    (['--sweep', 'gravity=1:2', '--sweep-seeds', '0:3'],
+     ['sweep', 'gravity=1:2', '--seeds', '0:3']),
+    (['--batch', '0:4', '--engine=step'],
+     ['batch', '--seeds', '0:4', '--engine', 'step']),
+    (['--terrains', 'a.json', 'b.json'],
+     ['batch', '--terrains', 'a.json', 'b.json']),
+])
+def test_legacy_argv(argv, expected):
+    assert legacy_argv(argv) == expected
+
+def test_engine_defaults():
+    assert parse_args(['--headless']).engine == 'step'
+    assert parse_args(['batch', '--seeds', '0:2']).engine == 'event'
+    assert parse_args(['gui', '--engine', 'lean']).engine == 'lean'
+
+@pytest.mark.parametrize('argv', [
+    ['gui', '--balls', '3', '--engine', 'lean'],
+    ['headless', '--balls', '2', '--engine', 'step'],
+    ['gui', '--engine', 'endless', '--render', 'image'],
+    ['gui', '--trail', '-1'],
+    ['batch', '--terrains', 'a.json', '--engine', 'endless'],
+])
+def test_rejected_options(argv):
+    with pytest.raises(SystemExit):
+        parse_args(argv)
@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+#  ╭────────────────────────────────╮
+#  │ Tests for the physics engines. │
+#  ╰────────────────────────────────╯
+
+import pytest
+
+from mountain_ball.config import DEFAULTS
+from mountain_ball.engine import BallEngine, EventEngine, LeanEngine, \
+    entry_time
+
+def test_entry_time_linear():
+    assert entry_time(0, 2, -4) == 2
+    assert entry_time(0, 0, -4) is None
+    assert entry_time(0, -2, 4) is None
+
+def test_entry_time_picks_the_entering_root():
+    #  ╭───────────────────────────────────────────────────────────╮
+    #  │ Both roots ahead, on either side of the parabola's vertex │
+    #  ╰───────────────────────────────────────────────────────────╯
+    assert entry_time(1, -3, 2) == 2
+    assert entry_time(-1, 3, -2) == 1
+    #  ╭─────────────────────────────────────────────╮
+    #  │ Both roots behind: the entry is in the past │
+    #  ╰─────────────────────────────────────────────╯
+    assert entry_time(1, 3, 2) == -1
+    assert entry_time(-1, -3, -2) == -2
+
+def test_entry_time_without_crossing():
+    assert entry_time(1, 0, 1) is None
+    #  ╭──────────────────────────────╮
+    #  │ A tangent touch never enters │
+    #  ╰──────────────────────────────╯
+    assert entry_time(1, -2, 1) is None
+
+def test_impact_time():
+    engine = EventEngine(seed=0)
+    assert engine.impact_time(1, -3, 2) == 2
+    #  ╭──────────────────────────────────────────────────────╮
+    #  │ Already overlapping and not moving out: collides now │
+    #  ╰──────────────────────────────────────────────────────╯
+    assert engine.impact_time(1, 3, 2) == 0.0
+    #  ╭─────────────────────────────────────╮
+    #  │ Entries in the past are not impacts │
+    #  ╰─────────────────────────────────────╯
+    assert engine.impact_time(-1, -3, -2) is None
+
+def assert_same_state(a, b):
+    assert a.ball_pos == b.ball_pos
+    assert a.ball_vel == b.ball_vel
+    assert a.counter == b.counter
+    assert a.steps == b.steps
+
+@pytest.mark.parametrize('seed', range(4))
+def test_lean_engine_matches_ball_engine(seed):
+    config = DEFAULTS.replace(restitution_x=0.9)
+    reference = BallEngine(seed=seed, config=config)
+    stepped = LeanEngine(seed=seed, config=config)
+    advanced = LeanEngine(seed=seed, config=config)
+    for _ in range(20):
+        for _ in range(1000):
+            reference.step()
+            stepped.step()
+        advanced.advance(1000)
+        assert_same_state(reference, stepped)
+        assert_same_state(reference, advanced)
+
+def test_lean_engine_rejects_per_ball_collision_calls():
+    engine = LeanEngine(seed=0)
+    for method in (engine.check_wall_collision, engine.check_collision,
+                   engine.resolve_collision):
+        with pytest.raises(TypeError):
+            method()
+
+def test_event_engine_steps_and_runs_alike():
+    #  ╭─────────────────────────────────────────────────────────────────╮
+    #  │ Stepping one time step at a time takes the same path as one run │
+    #  ╰─────────────────────────────────────────────────────────────────╯
+    stepped = EventEngine(seed=0)
+    for _ in range(30000):
+        stepped.step()
+    run = EventEngine(seed=0)
+    run.run(30)
+    assert stepped.counter == run.counter
+    assert stepped.time == pytest.approx(run.time)
@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+#  ╭────────────────────────────╮
+#  │ Tests for trajectory logs. │
+#  ╰────────────────────────────╯
+
+import pytest
+
+from mountain_ball.config import DEFAULTS
+from mountain_ball.engine import EventEngine
+from mountain_ball.replay import Recorder, Replay, record_headless
+
+@pytest.mark.parametrize('compress', (True, False))
+def test_round_trip(tmp_path, compress):
+    path = tmp_path / 'game.bmb'
+    config = DEFAULTS.replace(gravity=250)
+    score = record_headless(path, 120, seed=1, compress=compress,
+                            config=config)
+    replay = Replay(path)
+    try:
+        assert replay.seed == 1
+        assert replay.config == config
+        assert replay.duration == pytest.approx(120)
+        assert replay.state_at(replay.duration)['hits'] == score['hits']
+        #  ╭─────────────────────────────────────────────────────────────────╮
+        #  │                                                                 │
+        #  │ Every recorded state is reproduced exactly at its own time (the │
+        #  │ last one, where several events share a time)                    │
+        #  │                                                                 │
+        #  ╰─────────────────────────────────────────────────────────────────╯
+        latest = {t: (x, y, counter)
+                  for t, x, y, vx, vy, counter, kind in replay.events()}
+        for t, (x, y, counter) in latest.items():
+            state = replay.state_at(t)
+            assert (state['x'], state['y'], state['hits']) == (x, y, counter)
+        assert replay.verify()
+    finally:
+        replay.close()
+
+def test_state_after_the_end(tmp_path):
+    path = tmp_path / 'game.bmb'
+    record_headless(path, 5, seed=2)
+    replay = Replay(path)
+    try:
+        assert replay.state_at(10)['time'] == replay.duration
+    finally:
+        replay.close()
+
+def test_short_file_is_rejected(tmp_path):
+    path = tmp_path / 'short.bmb'
+    path.write_bytes(b'BMB')
+    with pytest.raises(ValueError):
+        Replay(path)
+
+def test_seed_must_fit_the_header(tmp_path):
+    path = tmp_path / 'big.bmb'
+    with pytest.raises(ValueError):
+        Recorder(path, EventEngine(seed=2**64))
+    assert not path.exists()
@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+#  ╭─────────────────────────────╮
+#  │ Tests for parameter sweeps. │
+#  ╰─────────────────────────────╯
+
+from mountain_ball.config import DEFAULTS
+from mountain_ball.sweep import SweepCache, parse_space, run_sweep, \
+    sweep_candidates
+
+def test_configs_are_hashable():
+    assert hash(DEFAULTS.replace()) == hash(DEFAULTS)
+    configs = {DEFAULTS, DEFAULTS.replace(), DEFAULTS.replace(gravity=1)}
+    assert len(configs) == 2
+
+def test_candidates_are_distinct():
+    space = parse_space(['gravity=200,200,250'])
+    assert len(sweep_candidates(space)) == 2
+
+def test_cache_drops_a_partial_line(tmp_path):
+    path = tmp_path / 'cache.jsonl'
+    cache = SweepCache(path)
+    cache.put('a', {'hpm': 1.0})
+    cache.close()
+    with open(path, 'a') as f:
+        f.write('{"key": "b", "sco')
+    cache = SweepCache(path)
+    cache.put('c', {'hpm': 3.0})
+    cache.close()
+    cache = SweepCache(path)
+    assert cache.results == {'a': {'hpm': 1.0}, 'c': {'hpm': 3.0}}
+    cache.close()
+
+def test_failing_candidate_is_dropped(tmp_path):
+    #  ╭───────────────────────────────────────────────────────╮
+    #  │ Restitution above 1 makes the endless engine overflow │
+    #  ╰───────────────────────────────────────────────────────╯
+    failing = DEFAULTS.replace(restitution_x=1.2)
+    ranking = run_sweep([DEFAULTS, failing], [0], duration=30,
+                        engine='endless', workers=1,
+                        cache=tmp_path / 'cache.jsonl')
+    assert [config for _, config, _ in ranking] == [DEFAULTS]
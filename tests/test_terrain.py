@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+#  ╭──────────────────────────────╮
+#  │ Tests for the terrain index. │
+#  ╰──────────────────────────────╯
+
+from mountain_ball.terrain import TerrainIndex
+
+SURFACE = [(0, 10), (10, 20), (20, 20), (30, 0)]
+
+def test_segment_at_breakpoints():
+    index = TerrainIndex(SURFACE)
+    #  ╭────────────────────────────────────────────╮
+    #  │ On a breakpoint the left-hand segment wins │
+    #  ╰────────────────────────────────────────────╯
+    assert index.segment_at(0) == 0
+    assert index.segment_at(10) == 0
+    assert index.segment_at(20) == 1
+    assert index.segment_at(30) == 2
+    #  ╭────────────────────────────────────────────╮
+    #  │ Just past a breakpoint is the next segment │
+    #  ╰────────────────────────────────────────────╯
+    assert index.segment_at(10.5) == 1
+    assert index.segment_at(20.5) == 2
+
+def test_segment_at_off_the_terrain():
+    index = TerrainIndex(SURFACE)
+    assert index.segment_at(-0.5) == -1
+    assert index.segment_at(30.5) == -1
+    assert index.height_at(31) is None
+
+def test_height_and_top():
+    index = TerrainIndex(SURFACE)
+    assert index.height_at(5) == 15
+    assert index.height_at(15) == 20
+    assert index.height_at(25) == 10
+    assert index.top == 0
+    assert index.last == 2
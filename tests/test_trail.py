@@ -0,0 +1,29 @@
+# -*- coding: utf-8 -*-
+#  ╭──────────────────────────────────╮
+#  │ Tests for the trail ring buffer. │
+#  ╰──────────────────────────────────╯
+
+from mountain_ball.trail import TrailBuffer
+
+def test_no_items_keeps_no_trail():
+    dots = TrailBuffer([])
+    assert dots.add(0.0) is None
+    assert len(dots) == 0
+    assert dots.expire(100.0) == []
+
+def test_full_buffer_reuses_the_oldest_dot():
+    dots = TrailBuffer(['a', 'b', 'c'])
+    assert [dots.add(t) for t in (0.0, 1.0, 2.0)] == ['a', 'b', 'c']
+    assert dots.add(3.0) == 'a'
+    assert len(dots) == 3
+
+def test_expire_frees_old_dots():
+    dots = TrailBuffer(['a', 'b', 'c'], lifetime=5)
+    for t in (0.0, 1.0, 2.0, 3.0):
+        dots.add(t)
+    #  ╭──────────────────────────────────────────────────────────────────╮
+    #  │ Dots at 1.0 (item b) and later are live; b is older than 6.5 - 5 │
+    #  ╰──────────────────────────────────────────────────────────────────╯
+    assert dots.expire(6.5) == ['b']
+    assert len(dots) == 2
+    assert dots.add(7.0) == 'b'